@@ -1,11 +1,35 @@
-import streamlit as st
-import plotly.graph_objects as go
-from io import BytesIO
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
+import atexit
+import html
 import json
+import streamlit as st
+import time
+import uuid
 from datetime import datetime
 
+from impact import store
+from impact.autosave import DraftWriter
+from impact.cohort import CohortStats, ordinal
+from impact.peers import build_peer_index
+from impact.core import (
+    DIMENSIONS, build_analysis, count_high_scores, get_analysis_key,
+    get_score_class, get_score_label, overall_score, report_file_name, validate_analysis
+)
+from impact.frameworks import EQUAL_WEIGHTS, CompiledFrameworks, load_frameworks, rank_order, ranks_from_order
+from impact.leaderboard import SORT_KEYS, Leaderboard
+from impact.loader import loads
+from impact.charts import (
+    create_portfolio_radar_spec, create_radar_animation, create_radar_chart, overlay_current_analysis
+)
+from impact.presentation import (
+    PAGE_CSS, card_header_html, card_labels_html, rubric_html, summary_scores_html
+)
+from impact.profiling import SectionProfiler
+from impact.reports import generate_word_doc
+from impact.sensitivity import DEFAULT_SPREAD, simulate_overall
+from impact.undo import EditHistory
+
+rerun_start = time.perf_counter()
+
 # --- Page Configuration ---
 st.set_page_config(
     page_title="Fintech IMPACT Radar",
@@ -14,503 +38,251 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# --- Rerun Profiler ---
+# Process-wide section timings; open the app with ?profile=1 to see them.
+@st.cache_resource
+def get_profiler():
+    return SectionProfiler()
+
+profiler = get_profiler()
+
 # --- Professional Custom CSS ---
-st.markdown("""
-    <style>
-    /* Main Background */
-    .stApp {
-        background-color: #ffffff;
-    }
-    
-    /* Main content area */
-    .main .block-container {
-        padding-top: 2rem;
-        max-width: 1400px;
-    }
-    
-    /* Sidebar */
-    [data-testid="stSidebar"] {
-        background-color: #f8f9fa;
-        border-right: 1px solid #e9ecef;
-    }
-    
-    /* Headers */
-    h1 {
-        color: #1a1a1a;
-        font-weight: 700;
-        font-size: 2.5rem !important;
-        margin-bottom: 0.5rem;
-        letter-spacing: -0.5px;
-    }
-    
-    h2 {
-        color: #2d3748;
-        font-weight: 600;
-        font-size: 1.5rem !important;
-        margin-top: 1rem;
-    }
-    
-    h3 {
-        color: #2d3748;
-        font-weight: 600;
-        font-size: 1.2rem !important;
-    }
-    
-    /* Remove default styling */
-    .stSlider {
-        padding-top: 0.5rem;
-        padding-bottom: 0.5rem;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        border-radius: 6px;
-        font-weight: 500;
-        padding: 0.5rem 1rem;
-        border: 1px solid #dee2e6;
-        background-color: white;
-        color: #495057;
-        transition: all 0.2s;
-    }
-    
-    .stButton > button:hover {
-        background-color: #f8f9fa;
-        border-color: #adb5bd;
-    }
-    
-    .stButton > button[kind="primary"] {
-        background-color: #0d6efd;
-        color: white;
-        border-color: #0d6efd;
-    }
-    
-    .stButton > button[kind="primary"]:hover {
-        background-color: #0b5ed7;
-        border-color: #0a58ca;
-    }
-    
-    /* Download button */
-    .stDownloadButton > button {
-        background-color: #0d6efd;
-        color: white;
-        border: none;
-        border-radius: 6px;
-        font-weight: 500;
-        padding: 0.5rem 1rem;
-    }
-    
-    .stDownloadButton > button:hover {
-        background-color: #0b5ed7;
-    }
-    
-    /* Text input */
-    .stTextInput > div > div > input {
-        border-radius: 6px;
-        border: 1px solid #ced4da;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #0d6efd;
-        box-shadow: 0 0 0 0.2rem rgba(13, 110, 253, 0.25);
-    }
-    
-    /* Text area */
-    .stTextArea textarea {
-        border-radius: 6px;
-        border: 1px solid #ced4da;
-        font-size: 0.9rem;
-    }
-    
-    .stTextArea textarea:focus {
-        border-color: #0d6efd;
-        box-shadow: 0 0 0 0.2rem rgba(13, 110, 253, 0.25);
-    }
-    
-    /* Expander */
-    .streamlit-expanderHeader {
-        background-color: #f8f9fa;
-        border-radius: 6px;
-        font-size: 0.9rem;
-        font-weight: 500;
-        border: 1px solid #dee2e6;
-    }
-    
-    /* Metric */
-    [data-testid="stMetricValue"] {
-        font-size: 1.75rem;
-        font-weight: 600;
-        color: #1a1a1a;
-    }
-    
-    [data-testid="stMetricLabel"] {
-        font-size: 0.875rem;
-        color: #6c757d;
-        font-weight: 500;
-    }
-    
-    /* Rubric Table */
-    .rubric-table { 
-        font-size: 0.875rem; 
-        width: 100%; 
-        border-collapse: collapse;
-        margin-top: 0.5rem;
-    }
-    
-    .rubric-table td { 
-        padding: 0.75rem; 
-        border: 1px solid #dee2e6;
-        vertical-align: top;
-        background-color: white;
-    }
-    
-    .rubric-header { 
-        font-weight: 600; 
-        color: #495057;
-        background-color: #f8f9fa;
-        width: 100px;
-    }
-    
-    /* Card Container */
-    .card-container {
-        background-color: white;
-        border: 1px solid #dee2e6;
-        border-radius: 8px;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-    }
-    
-    /* Score badge */
-    .score-display {
-        font-size: 1.5rem;
-        font-weight: 700;
-        text-align: center;
-        padding: 0.5rem;
-        border-radius: 6px;
-        margin-bottom: 0.5rem;
-    }
-    
-    .score-low {
-        background-color: #fff5f5;
-        color: #c53030;
-        border: 2px solid #fc8181;
-    }
-    
-    .score-medium {
-        background-color: #fffbf0;
-        color: #c05621;
-        border: 2px solid #f6ad55;
-    }
-    
-    .score-high {
-        background-color: #f0fdf4;
-        color: #15803d;
-        border: 2px solid #4ade80;
-    }
-    
-    /* Dimension card */
-    .dimension-card {
-        background: white;
-        border: 1px solid #e9ecef;
-        border-radius: 8px;
-        padding: 1.25rem;
-        height: 100%;
-        transition: box-shadow 0.2s;
-    }
-    
-    .dimension-card:hover {
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-    }
-    
-    .dimension-title {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #2d3748;
-        margin-bottom: 0.25rem;
-    }
-    
-    .dimension-question {
-        font-size: 0.875rem;
-        color: #6c757d;
-        font-style: italic;
-        margin-bottom: 1rem;
-    }
-    
-    /* Labels */
-    .slider-label {
-        font-size: 0.8rem;
-        color: #6c757d;
-        font-weight: 500;
-    }
-    
-    /* Divider */
-    hr {
-        margin: 2rem 0;
-        border: none;
-        border-top: 1px solid #e9ecef;
-    }
-    </style>
-""", unsafe_allow_html=True)
+with profiler.section("page_css"):
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
-# --- Data Definitions ---
-DIMENSIONS = [
-    {
-        'id': 'integration',
-        'letter': 'I',
-        'icon': '🔗',
-        'title': 'Integration',
-        'subtitle': 'Connectivity',
-        'color': '#0d6efd',
-        'lightColor': '#e7f1ff',
-        'question': 'Is it an Island or an Ecosystem?',
-        'leftLabel': 'Closed / Island',
-        'rightLabel': 'Open API Platform',
-        'rubric': {
-            'low': 'Closed system. No APIs. Hard to export data. "Walled Garden."',
-            'medium': 'Some integrations (e.g., connects to Xero), but largely self-contained.',
-            'high': 'API-first architecture. Allows developers to build on top. Two-way data flow.'
-        }
-    },
-    {
-        'id': 'monetization',
-        'letter': 'M',
-        'icon': '💰',
-        'title': 'Monetization',
-        'subtitle': 'Unit Economics',
-        'color': '#198754',
-        'lightColor': '#d1f4e8',
-        'question': 'Growth at all costs or sustainable?',
-        'leftLabel': 'Burning Cash',
-        'rightLabel': 'Sustainable Profit',
-        'rubric': {
-            'low': 'Freemium with no clear upsell. High burn. Subsidized by VC money.',
-            'medium': 'Generating revenue (interchange fees), but barely covering costs.',
-            'high': 'Strong LTV > CAC. Diversified revenue (Sub + Trans + Data).'
-        }
-    },
-    {
-        'id': 'painPoint',
-        'letter': 'P',
-        'icon': '🩹',
-        'title': 'Pain Point',
-        'subtitle': 'Differentiation',
-        'color': '#dc3545',
-        'lightColor': '#ffe5e8',
-        'question': 'Vitamin or Painkiller?',
-        'leftLabel': 'Nice-to-have (UI)',
-        'rightLabel': '10x Solution',
-        'rubric': {
-            'low': 'Cosmetic changes. Just a prettier app for a standard bank account.',
-            'medium': 'Reduces friction (faster onboarding), but core product is standard.',
-            'high': 'Solves deep friction (e.g., instant cross-border). Users cannot go back.'
-        }
-    },
-    {
-        'id': 'automation',
-        'letter': 'A',
-        'icon': '🤖',
-        'title': 'Automation',
-        'subtitle': 'Tech Depth',
-        'color': '#6610f2',
-        'lightColor': '#f0e7ff',
-        'question': 'Wrapper or Deep Tech?',
-        'leftLabel': 'Human/Manual',
-        'rightLabel': 'AI/Algorithmic',
-        'rubric': {
-            'low': 'Manual processes behind scenes. Rule-based logic only.',
-            'medium': 'Some automation in KYC, but support is human-heavy.',
-            'high': 'Proprietary AI/ML models. Algorithmic underwriting. Self-driving finance.'
-        }
-    },
-    {
-        'id': 'compliance',
-        'letter': 'C',
-        'icon': '⚖️',
-        'title': 'Compliance',
-        'subtitle': 'Trust',
-        'color': '#fd7e14',
-        'lightColor': '#fff3e6',
-        'question': 'Regulatory Arbitrage or Trust?',
-        'leftLabel': 'Grey Area',
-        'rightLabel': 'Fully Licensed',
-        'rubric': {
-            'low': 'Unregulated. Operating across borders to avoid rules.',
-            'medium': 'Partnering with a sponsor bank (BaaS) to rent a license.',
-            'high': 'Full Banking Charter. Direct regulator relationship. Heavy compliance.'
-        }
-    },
-    {
-        'id': 'target',
-        'letter': 'T',
-        'icon': '🎯',
-        'title': 'Target',
-        'subtitle': 'Inclusion',
-        'color': '#0dcaf0',
-        'lightColor': '#e7f8fc',
-        'question': 'Mass Market or Niche?',
-        'leftLabel': 'Mass Market',
-        'rightLabel': 'Underserved Niche',
-        'rubric': {
-            'low': 'Competing for prime customers (High FICO) like major banks.',
-            'medium': 'Millennials/Gen-Z focus, but still generally bankable.',
-            'high': 'Unbanked, gig-workers, immigrants, or specific vertical niches.'
-        }
-    }
-]
-
-# --- Helper Functions ---
-def get_score_color(score):
-    if score < 30: return "#c53030"
-    if score < 70: return "#c05621"
-    return "#15803d"
-
-def get_score_class(score):
-    if score < 30: return "score-low"
-    if score < 70: return "score-medium"
-    return "score-high"
-
-def get_score_label(score):
-    if score < 30: return "Low Impact"
-    if score < 70: return "Medium Impact"
-    return "High Impact"
-
-def create_radar_chart(values, show_benchmark):
-    categories = [d['title'] for d in DIMENSIONS]
-    
-    r_values = list(values) + [values[0]]
-    theta_values = categories + [categories[0]]
-    
-    fig = go.Figure()
-
-    fig.add_trace(go.Scatterpolar(
-        r=r_values,
-        theta=theta_values,
-        fill='toself',
-        name='Current Analysis',
-        line=dict(color='#0d6efd', width=2),
-        fillcolor='rgba(13, 110, 253, 0.2)',
-        marker=dict(size=8, color='#0d6efd')
-    ))
-
-    if show_benchmark:
-        bank_values = [20, 80, 20, 30, 95, 20] 
-        bank_r = bank_values + [bank_values[0]]
-        
-        fig.add_trace(go.Scatterpolar(
-            r=bank_r,
-            theta=theta_values,
-            fill='toself',
-            name='Traditional Bank',
-            line=dict(color='#6c757d', width=2, dash='dash'),
-            fillcolor='rgba(108, 117, 125, 0.1)',
-            marker=dict(size=6, color='#6c757d')
-        ))
-
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickfont=dict(size=11, color='#495057'),
-                gridcolor='#dee2e6',
-                linecolor='#dee2e6'
-            ),
-            angularaxis=dict(
-                gridcolor='#dee2e6',
-                linecolor='#dee2e6',
-                tickfont=dict(size=11, color='#495057', weight=600)
-            ),
-            bgcolor='white'
-        ),
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.2,
-            xanchor="center",
-            x=0.5,
-            font=dict(size=12, color='#495057')
-        ),
-        margin=dict(l=80, r=80, t=40, b=80),
-        height=500,
-        paper_bgcolor="white",
-        plot_bgcolor="white",
-        font=dict(family="system-ui, -apple-system, sans-serif", color='#495057')
+# --- Export Cache ---
+# Exports are built only when a download button is clicked and memoized by
+# a hash of the analysis state, so unchanged analyses are never rebuilt.
+# Reports are also keyed by the minute they print and the benchmark
+# setting; JSON documents are cached unstamped and get the current time on
+# every download.
+@st.cache_data(max_entries=16, show_spinner=False)
+def build_docx_export(analysis_key, _company_name, _scores, _notes, timestamp, show_benchmark):
+    with get_profiler().section("export_docx"):
+        return generate_word_doc(_company_name, overall_score(_scores), timestamp, _scores, _notes,
+                                 show_benchmark).getvalue()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def build_analysis_export(analysis_key, _company_name, _scores, _notes):
+    return build_analysis(_company_name, _scores, _notes)
+
+def build_json_export(analysis_key, company_name, scores, notes):
+    with get_profiler().section("export_json"):
+        data = build_analysis_export(analysis_key, company_name, scores, notes)
+        data['timestamp'] = datetime.now().isoformat()
+        return json.dumps(data, indent=2)
+
+# --- Sensitivity Analysis ---
+@st.cache_data(max_entries=64, show_spinner=False)
+def simulate_scores(scores, spreads):
+    with get_profiler().section("sensitivity_simulation"):
+        return simulate_overall(scores, spreads)
+
+# --- Portfolio Store ---
+@st.cache_resource
+def get_portfolio_store():
+    return store.connect()
+
+@st.cache_resource
+def get_peer_index():
+    return build_peer_index(get_portfolio_store())
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_portfolio_radar(classification, limit, show_benchmark, last_id):
+    # last_id keys the cache on the store contents, so new saves rebuild it
+    rows = store.query_analyses(
+        get_portfolio_store(), classification=classification, limit=limit,
+        columns=f"company_name, timestamp, {', '.join(store.SCORE_COLUMNS)}"
     )
-    return fig
+    portfolio = [
+        (f"{row['company_name'] or 'Unnamed'} ({row['timestamp'][:10]})", [row[c] for c in store.SCORE_COLUMNS])
+        for row in rows
+    ]
+    return create_portfolio_radar_spec(portfolio, show_benchmark)
 
-def generate_word_doc(company_name, avg_score, timestamp):
-    doc = Document()
-    
-    heading = doc.add_heading('FINTECH IMPACT RADAR ANALYSIS', 0)
-    heading.alignment = 1
-    
-    doc.add_paragraph()
-    p = doc.add_paragraph()
-    run = p.add_run(f"Company: {company_name if company_name else 'Not specified'}")
-    run.bold = True
-    run.font.size = Pt(14)
-    
-    p2 = doc.add_paragraph()
-    run2 = p2.add_run(f"Analysis Date: {timestamp}")
-    run2.font.size = Pt(10)
-    run2.font.color.rgb = RGBColor(108, 117, 125)
-    
-    doc.add_heading(f'Overall IMPACT Score: {avg_score}/100', level=1)
-    score_label = get_score_label(avg_score)
-    p3 = doc.add_paragraph(f"Assessment: {score_label}")
-    p3.runs[0].italic = True
-    
-    doc.add_page_break()
-    
-    for dim in DIMENSIONS:
-        score = st.session_state[f"score_{dim['id']}"]
-        notes = st.session_state[f"note_{dim['id']}"]
-        
-        doc.add_heading(f"{dim['icon']} {dim['title']} - {score}/100", level=2)
-        doc.add_paragraph(f"Focus: {dim['subtitle']}")
-        doc.add_paragraph(f"Key Question: {dim['question']}")
-        
-        doc.add_heading('Scoring Rubric:', level=3)
-        doc.add_paragraph(f"Low (0-30): {dim['rubric']['low']}")
-        doc.add_paragraph(f"Medium (31-70): {dim['rubric']['medium']}")
-        doc.add_paragraph(f"High (71-100): {dim['rubric']['high']}")
-        
-        doc.add_heading('Analysis & Evidence:', level=3)
-        if notes:
-            doc.add_paragraph(notes)
-        else:
-            doc.add_paragraph("No notes recorded.")
-        
-        doc.add_paragraph("_" * 70)
-    
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
-    return buffer
-
-def export_json():
-    data = {
-        'company_name': st.session_state.company_name,
-        'timestamp': datetime.now().isoformat(),
-        'overall_score': round(sum([st.session_state[f"score_{d['id']}"] for d in DIMENSIONS]) / 6),
-        'dimensions': {}
-    }
-    
-    for dim in DIMENSIONS:
-        data['dimensions'][dim['id']] = {
-            'title': dim['title'],
-            'score': st.session_state[f"score_{dim['id']}"],
-            'notes': st.session_state[f"note_{dim['id']}"]
-        }
-    
-    return json.dumps(data, indent=2)
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_cohort_stats(last_id):
+    # Exact per-dimension score histograms of the whole portfolio, kept by
+    # store triggers; last_id keys the cache so new saves are picked up.
+    return CohortStats.from_histograms(store.score_histograms(get_portfolio_store()))
+
+# --- Scoring Frameworks ---
+# Weighting schemes from frameworks.json (IMPACT_FRAMEWORKS_PATH), loaded
+# once per process. Every stored analysis is scored under every scheme in
+# one matrix product over the peer index's score matrix, and each scheme's
+# ranking is sorted once per store version.
+@st.cache_resource
+def get_frameworks():
+    # (compiled schemes, load error); a bad file falls back to equal weights
+    try:
+        return CompiledFrameworks(load_frameworks()), None
+    except (OSError, ValueError) as e:
+        return CompiledFrameworks([EQUAL_WEIGHTS]), str(e)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_framework_scores(last_id):
+    index = get_peer_index()
+    index.refresh(get_portfolio_store())
+    arrays = index.arrays
+    return arrays.ids, arrays.names, arrays.timestamps, get_frameworks()[0].score(arrays.vectors)
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def get_framework_ranking(k, last_id):
+    order = rank_order(get_framework_scores(last_id)[3][:, k])
+    return order, ranks_from_order(order)
+
+# --- Leaderboard ---
+# One process-wide leaderboard over the peer index's arrays; each view
+# merges in analyses saved since the last one and ships only its page.
+@st.cache_resource
+def get_leaderboard():
+    return Leaderboard()
+
+def refresh_leaderboard():
+    board = get_leaderboard()
+    index = get_peer_index()
+    index.refresh(get_portfolio_store())
+    arrays = index.arrays
+    board.update(arrays.ids, arrays.names, arrays.timestamps, arrays.vectors)
+    return board
+
+# --- Autosave ---
+# Drafts are keyed by a ?draft= id kept in the URL, so a reload, reconnect
+# or server restart on the same URL restores the last autosaved state.
+# The state a session starts from (defaults or the restored draft) counts
+# as saved, so untouched sessions never write a draft row.
+@st.cache_resource
+def get_draft_writer():
+    writer = DraftWriter()
+    atexit.register(writer.close)
+    return writer
+
+def draft_state(company_name, scores, notes):
+    return (company_name, tuple(scores), tuple(notes))
+
+def autosave_draft(snapshot):
+    # Only hands changed drafts to the writer thread; never touches disk
+    with profiler.section("autosave"):
+        draft = draft_state(snapshot['company_name'], snapshot['scores'], snapshot['notes'])
+        if st.session_state.autosaved_draft != draft:
+            st.session_state.autosaved_draft = draft
+            get_draft_writer().submit(st.session_state.draft_id, *draft)
+
+def restore_draft():
+    draft_id = st.query_params.get("draft")
+    if draft_id:
+        draft = store.load_draft(get_portfolio_store(), draft_id)
+        try:
+            if draft:
+                apply_analysis(draft)
+                st.toast(f"Restored your draft from {draft['timestamp'][:16].replace('T', ' ')}")
+        except ValueError:
+            pass
+    else:
+        draft_id = uuid.uuid4().hex
+        st.query_params["draft"] = draft_id
+    st.session_state.draft_id = draft_id
+    st.session_state.autosaved_draft = draft_state(
+        st.session_state.company_name,
+        [st.session_state[f"score_{dim['id']}"] for dim in DIMENSIONS],
+        [st.session_state[f"note_{dim['id']}"] for dim in DIMENSIONS],
+    )
+
+def apply_analysis(data):
+    company_name, scores, notes, _ = validate_analysis(data)
+    st.session_state.company_name = company_name
+    for dim, score, note in zip(DIMENSIONS, scores, notes):
+        st.session_state[f"score_{dim['id']}"] = score
+        st.session_state[f"note_{dim['id']}"] = note
+
+def import_analysis():
+    # on_change of the JSON uploader; validates before touching any state
+    uploaded = st.session_state.import_file
+    if uploaded is None:
+        return
+    try:
+        apply_analysis(loads(uploaded.getvalue()))
+    except ValueError as e:
+        st.session_state.import_error = f"Could not import {uploaded.name}: {e}"
+    else:
+        st.session_state.pop('import_error', None)
+
+def load_saved_analysis(analysis_id):
+    data = store.load_analysis(get_portfolio_store(), analysis_id)
+    if data:
+        apply_analysis(data)
+
+# --- Analysis Snapshot ---
+# A plain dict kept in session state and updated in place. Fragments write
+# note edits into it and the export callables read it at click time, so
+# exports never see stale values after a fragment-only rerun.
+def sync_analysis_snapshot():
+    snapshot = st.session_state.setdefault('analysis_snapshot', {})
+    snapshot['company_name'] = st.session_state.company_name
+    snapshot['scores'] = [st.session_state[f"score_{d['id']}"] for d in DIMENSIONS]
+    snapshot['notes'] = [st.session_state[f"note_{d['id']}"] for d in DIMENSIONS]
+    return snapshot
+
+def snapshot_export_args(snapshot):
+    company_name = snapshot['company_name']
+    scores, notes = tuple(snapshot['scores']), tuple(snapshot['notes'])
+    return get_analysis_key(company_name, scores, notes), company_name, scores, notes
 
 def reset_state():
     st.session_state.company_name = ""
     for dim in DIMENSIONS:
         st.session_state[f"score_{dim['id']}"] = 50
         st.session_state[f"note_{dim['id']}"] = ""
+        st.session_state[f"spread_{dim['id']}"] = DEFAULT_SPREAD
+
+# --- Uncertainty Ranges ---
+# The ± range sliders only exist while Uncertainty Mode is on, and Streamlit
+# drops the state of widgets that are not rendered. Ranges therefore live
+# under spread_<id>; each slider is seeded from it and writes back on change.
+def store_spread(dim_id):
+    st.session_state[f"spread_{dim_id}"] = st.session_state[f"spread_slider_{dim_id}"]
+
+# --- Undo / Redo ---
+# Full reruns record company name, scores and notes; note fragments record
+# their own note. Each change set becomes one delta entry, so a reset or a
+# loaded analysis undoes in one step. The buttons are disabled when there
+# is nothing to undo or redo; a note edit that changes that reruns the app.
+def tracked_state():
+    values = {'company_name': st.session_state.company_name}
+    for dim in DIMENSIONS:
+        values[f"score_{dim['id']}"] = st.session_state[f"score_{dim['id']}"]
+        values[f"note_{dim['id']}"] = st.session_state[f"note_{dim['id']}"]
+    return values
+
+def undo_edit():
+    for key, value in st.session_state.edit_history.undo().items():
+        st.session_state[key] = value
+
+def redo_edit():
+    for key, value in st.session_state.edit_history.redo().items():
+        st.session_state[key] = value
+
+# --- Notes Search ---
+def highlight_snippet(snippet):
+    return html.escape(snippet).replace(store.SNIPPET_START, "<mark>").replace(store.SNIPPET_END, "</mark>")
+
+@st.fragment
+def notes_search_fragment():
+    with profiler.section("notes_search"):
+        query = st.text_input("Search Notes", placeholder="e.g., open banking", key="notes_search")
+        if not query:
+            return
+        hits = store.search_notes(get_portfolio_store(), query)
+        if not hits:
+            st.caption("No saved notes match.")
+        for _, company_name, timestamp, dim_idx, snippet in hits:
+            dim = DIMENSIONS[dim_idx]
+            st.markdown(f"""
+                <div style='font-size: 0.85rem; margin-bottom: 0.75rem;'>
+                    <strong>{html.escape(company_name or 'Unnamed')}</strong> · {dim['icon']} {dim['title']} · {timestamp[:10]}<br>
+                    <span style='color: #495057;'>{highlight_snippet(snippet)}</span>
+                </div>
+            """, unsafe_allow_html=True)
 
 # --- Initialize Session State ---
 if 'company_name' not in st.session_state:
@@ -520,13 +292,27 @@ for dim in DIMENSIONS:
         st.session_state[f"score_{dim['id']}"] = 50
     if f"note_{dim['id']}" not in st.session_state:
         st.session_state[f"note_{dim['id']}"] = ""
+    if f"spread_{dim['id']}" not in st.session_state:
+        st.session_state[f"spread_{dim['id']}"] = DEFAULT_SPREAD
+
+if 'draft_id' not in st.session_state:
+    restore_draft()
+if 'edit_history' not in st.session_state:
+    st.session_state.edit_history = EditHistory()
+st.session_state.edit_history.record(tracked_state())
 
 # Calculate metrics
-current_scores = [st.session_state[f"score_{d['id']}"] for d in DIMENSIONS]
-avg_score = round(sum(current_scores) / 6)
+analysis_snapshot = sync_analysis_snapshot()
+autosave_draft(analysis_snapshot)
+current_scores = analysis_snapshot['scores']
+avg_score = overall_score(current_scores)
+
+cohort = get_cohort_stats(store.latest_id(get_portfolio_store()))
+cohort_ranks = cohort.percentile_rank(current_scores, avg_score) if cohort.size else None
+cohort_bands = cohort.bands() if cohort.size else None
 
 # --- SIDEBAR ---
-with st.sidebar:
+with st.sidebar, profiler.section("sidebar"):
     st.title("📡 Analysis Controls")
     
     st.markdown("### Company Information")
@@ -535,6 +321,17 @@ with st.sidebar:
     st.markdown("")
     st.markdown("### Display Options")
     show_benchmark = st.checkbox("Show Traditional Bank Benchmark", value=True)
+    peer_count = st.slider("Nearest Peers to Overlay", 0, 10, 0, help="Most similar saved analyses by score profile")
+    portfolio_mode = st.toggle("Portfolio Radar", help="Overlay saved analyses from the portfolio")
+    portfolio_filter = portfolio_size = None
+    if portfolio_mode:
+        portfolio_filter = st.selectbox("Portfolio Filter", ["All", "High Impact", "Medium Impact", "Low Impact"])
+        portfolio_size = st.slider("Companies to Overlay", 10, 1000, 200, step=10)
+    history_mode = st.toggle("Company History", help="Trends and an animated radar across saved analyses")
+    leaderboard_mode = st.toggle("Portfolio Leaderboard", help="Rank, sort and filter every saved analysis")
+    frameworks_mode = st.toggle("Scoring Frameworks", help="Score and re-rank the portfolio under weighted frameworks")
+    uncertainty_mode = st.toggle("Uncertainty Mode", key="uncertainty_mode",
+                                 help="Give each score a ± range and simulate the overall score")
     
     st.markdown("---")
     
@@ -543,38 +340,69 @@ with st.sidebar:
     with col1:
         st.metric("Overall Score", f"{avg_score}")
     with col2:
-        high_scores = sum(1 for s in current_scores if s >= 70)
+        high_scores = count_high_scores(current_scores)
         st.metric("High Scores", f"{high_scores}/6")
     
     st.markdown("---")
     
     st.markdown("### Export Options")
     
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    export_name = analysis_snapshot['company_name']
     
-    docx_file = generate_word_doc(st.session_state.company_name, avg_score, timestamp)
     st.download_button(
         label="Download Report (DOCX)", 
-        data=docx_file,
-        file_name=f"IMPACT_Analysis_{st.session_state.company_name or 'Company'}_{datetime.now().strftime('%Y%m%d')}.docx",
+        data=lambda: build_docx_export(*snapshot_export_args(analysis_snapshot), datetime.now().strftime("%Y-%m-%d %H:%M"),
+                                       show_benchmark),
+        file_name=report_file_name(export_name, datetime.now()),
         mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        on_click="ignore",
         use_container_width=True
     )
     
-    json_data = export_json()
     st.download_button(
         label="Download Data (JSON)",
-        data=json_data,
-        file_name=f"IMPACT_Data_{st.session_state.company_name or 'Company'}_{datetime.now().strftime('%Y%m%d')}.json",
+        data=lambda: build_json_export(*snapshot_export_args(analysis_snapshot)),
+        file_name=report_file_name(export_name, datetime.now(), 'json'),
         mime="application/json",
+        on_click="ignore",
         use_container_width=True
     )
     
+    st.file_uploader("Import Analysis (JSON)", type="json", key="import_file", on_change=import_analysis,
+                     help="Restore an analysis from a Download Data (JSON) file")
+    if 'import_error' in st.session_state:
+        st.error(st.session_state.import_error)
+    
     st.markdown("")
+    st.markdown("### Portfolio")
     
-    if st.button("Reset Analysis", use_container_width=True):
-        reset_state()
-        st.rerun()
+    portfolio = get_portfolio_store()
+    if st.button("Save to Portfolio", use_container_width=True):
+        store.save_analysis(portfolio, build_analysis(export_name, current_scores, analysis_snapshot['notes']))
+        st.success(f"Saved {export_name or 'analysis'} to portfolio")
+    
+    saved = {row['id']: row for row in store.recent_analyses(portfolio)}
+    if saved:
+        selected_id = st.selectbox(
+            "Saved Analyses",
+            list(saved),
+            format_func=lambda i: f"{saved[i]['company_name'] or 'Unnamed'} · {saved[i]['timestamp'][:10]} · {saved[i]['overall_score']}",
+        )
+        st.button("Load Analysis", on_click=load_saved_analysis, args=(selected_id,), use_container_width=True)
+    
+    notes_search_fragment()
+    
+    st.markdown("")
+    
+    col_undo, col_redo = st.columns(2)
+    with col_undo:
+        st.button("↶ Undo", on_click=undo_edit, use_container_width=True,
+                  disabled=not st.session_state.edit_history.can_undo,
+                  help="Undo the last change to the company name, a score or a note")
+    with col_redo:
+        st.button("↷ Redo", on_click=redo_edit, use_container_width=True,
+                  disabled=not st.session_state.edit_history.can_redo)
+    st.button("Reset Analysis", on_click=reset_state, use_container_width=True)
     
     st.markdown("---")
     
@@ -590,6 +418,276 @@ with st.sidebar:
         - **Target**: Market inclusion
         """)
 
+# --- Fragments ---
+# Only parts that own widgets are fragments: each card's rubric & notes
+# expander and the optional portfolio panels. Their dependencies:
+#   score_*  -> card header, radar chart, summary column, sidebar metrics
+#   note_*   -> its own expander, exports (via the analysis snapshot)
+# Score sliders therefore stay in the main flow: moving one (or editing the
+# company name) still reruns the whole script. Only editing notes reruns
+# just that card's expander. The radar chart, summary
+# and uncertainty sections have no widgets of their own and are drawn by
+# the full rerun that changed their inputs.
+def radar_chart_section(scores, show_benchmark, peer_count, portfolio_filter, portfolio_size):
+    with profiler.section("radar_chart"):
+        st.markdown("### Radar Visualization")
+        peers = []
+        if peer_count:
+            peer_index = get_peer_index()
+            peer_index.refresh(get_portfolio_store())
+            peers = peer_index.query(scores, peer_count, exclude_name=st.session_state.company_name)
+        if portfolio_filter:
+            portfolio_spec = get_portfolio_radar(
+                None if portfolio_filter == "All" else portfolio_filter, portfolio_size,
+                show_benchmark, store.latest_id(get_portfolio_store())
+            )
+            radar_fig = overlay_current_analysis(portfolio_spec, scores)
+        else:
+            radar_fig = create_radar_chart(
+                scores, show_benchmark,
+                [(f"{name or 'Unnamed'} ({ts[:10]})", peer_scores) for _, name, ts, _, peer_scores in peers]
+            )
+        st.plotly_chart(radar_fig, use_container_width=True)
+        if peers:
+            st.caption("Nearest peers: " + ", ".join(
+                f"{name or 'Unnamed'} (distance {dist:.1f})" for _, name, _, dist, _ in peers
+            ))
+
+def summary_section(scores):
+    with profiler.section("overall_assessment"):
+        st.markdown("### Overall Assessment")
+    
+        avg_score = overall_score(scores)
+        score_class = get_score_class(avg_score)
+        st.markdown(f"""
+            <div class='score-display {score_class}'>
+                {avg_score} / 100
+            </div>
+        """, unsafe_allow_html=True)
+    
+        st.markdown(f"**Classification:** {get_score_label(avg_score)}")
+        if cohort_ranks is not None:
+            st.caption(f"{ordinal(cohort_ranks[-1])} percentile of {cohort.size:,} saved "
+                       f"{'analysis' if cohort.size == 1 else 'analyses'}")
+    
+        st.markdown("")
+        st.markdown("**Dimension Scores:**")
+    
+        st.markdown(summary_scores_html(scores, cohort_ranks), unsafe_allow_html=True)
+
+def uncertainty_section(scores, spreads):
+    with profiler.section("uncertainty"):
+        st.markdown("### Score Uncertainty")
+        result = simulate_scores(tuple(scores), tuple(spreads))
+        st.markdown(
+            f"Across {result['draws']:,} simulated analyses the overall score has a median of "
+            f"**{result['p50']}** and a 90% interval of **{result['p5']}–{result['p95']}**."
+        )
+        chart_col, prob_col = st.columns([2, 1])
+        with chart_col:
+            st.bar_chart(
+                {"Overall score": list(range(101)),
+                 "Share of draws": [c / result['draws'] for c in result['histogram']]},
+                x="Overall score", y="Share of draws", height=220
+            )
+        with prob_col:
+            for label, probability in result['probabilities'].items():
+                st.metric(f"P({label})", f"{probability:.1%}")
+
+FRAMEWORK_TOP_N = 100
+
+@st.fragment
+def frameworks_fragment(scores):
+    with profiler.section("frameworks"):
+        st.markdown("### Scoring Frameworks")
+        frameworks, error = get_frameworks()
+        if error:
+            st.error(f"Could not load frameworks, using equal weights: {error}")
+        k = st.selectbox("Framework", range(len(frameworks)), format_func=frameworks.names.__getitem__, key="framework")
+        framework = frameworks.frameworks[k]
+        thresholds = framework['thresholds']
+        st.caption(
+            f"{framework['description']} Weights: "
+            + ", ".join(f"{title} {share:.0%}" for title, share in frameworks.weight_shares(k))
+            + f". Low below {thresholds['low']}, high from {thresholds['high']}."
+        )
+
+        current = frameworks.score(scores)
+        col_current, col_portfolio = st.columns([1, 2])
+        with col_current:
+            st.markdown("**This analysis**")
+            st.dataframe(
+                {"Framework": frameworks.names, "Score": current[0].tolist(),
+                 "Classification": frameworks.labels(current)[0].tolist()},
+                hide_index=True
+            )
+        with col_portfolio:
+            last_id = store.latest_id(get_portfolio_store())
+            _, names, timestamps, overall = get_framework_scores(last_id)
+            st.markdown(f"**Portfolio top {FRAMEWORK_TOP_N}** of {len(names):,}")
+            if not len(names):
+                st.caption("Save analyses to rank the portfolio under each framework.")
+                return
+            order, ranks = get_framework_ranking(k, last_id)
+            base_ranks = get_framework_ranking(0, last_id)[1]
+            top = order[:FRAMEWORK_TOP_N]
+            st.dataframe(
+                {"Rank": ranks[top].tolist(),
+                 "Change": (base_ranks[top] - ranks[top]).tolist(),
+                 "Company": [name or 'Unnamed' for name in names[top]],
+                 "Date": [ts[:10] for ts in timestamps[top]],
+                 "Score": overall[top, k].tolist(),
+                 "Classification": frameworks.labels(overall[top])[:, k].tolist()},
+                hide_index=True, height=300,
+                column_config={"Change": st.column_config.NumberColumn(help="Places gained vs equal weights", format="%+d")}
+            )
+
+SORT_LABELS = dict(zip(SORT_KEYS, ["Overall"] + [d['title'] for d in DIMENSIONS] + ["Date", "Company"]))
+PAGE_SIZES = [25, 50, 100]
+
+@st.fragment
+def leaderboard_fragment():
+    with profiler.section("leaderboard"):
+        st.markdown("### Portfolio Leaderboard")
+        col_sort, col_order, col_class, col_search = st.columns([1.2, 1.2, 1, 1.5])
+        with col_sort:
+            sort_key = st.selectbox("Sort by", SORT_KEYS, format_func=SORT_LABELS.get, key="leaderboard_sort")
+        with col_order:
+            order = st.radio("Order", ["Descending", "Ascending"], horizontal=True, key="leaderboard_order")
+        with col_class:
+            classification = st.selectbox("Classification", ["All", "High Impact", "Medium Impact", "Low Impact"],
+                                          key="leaderboard_class")
+        with col_search:
+            search = st.text_input("Company contains", key="leaderboard_search")
+
+        # Any change of view starts again at the first page
+        view = (sort_key, order, classification, search)
+        if st.session_state.get('leaderboard_view') != view:
+            st.session_state.leaderboard_view = view
+            st.session_state.leaderboard_page = 1
+
+        board = refresh_leaderboard()
+        page_size = st.session_state.setdefault('leaderboard_page_size', PAGE_SIZES[1])
+        page = st.session_state.get('leaderboard_page', 1)
+        total, rows = board.page(sort_key, order == "Descending", None if classification == "All" else classification,
+                                 search, page - 1, page_size)
+        pages = max(1, -(-total // page_size))
+        if page > pages:
+            page = st.session_state.leaderboard_page = pages
+            total, rows = board.page(sort_key, order == "Descending", None if classification == "All" else classification,
+                                     search, page - 1, page_size)
+
+        if not total:
+            st.caption("No saved analyses match." if len(board) else "Save analyses to build the leaderboard.")
+            return
+        table = {"Rank": rows['rank'], "Company": [name or 'Unnamed' for name in rows['company_name']],
+                 "Overall": rows['overall_score'], "Classification": rows['classification']}
+        for dim in DIMENSIONS:
+            table[dim['title']] = rows[dim['id']]
+        table["Date"] = [ts[:10] for ts in rows['timestamp']]
+        st.dataframe(table, hide_index=True)
+
+        col_info, col_page, col_size = st.columns([2, 1, 1])
+        with col_info:
+            st.caption(f"Rows {(page - 1) * page_size + 1:,}–{(page - 1) * page_size + len(rows['rank']):,} "
+                       f"of {total:,} · page {page:,} of {pages:,}")
+        with col_page:
+            st.number_input("Page", 1, pages, key="leaderboard_page")
+        with col_size:
+            st.selectbox("Rows per page", PAGE_SIZES, key="leaderboard_page_size")
+
+HISTORY_LIMIT = 200
+
+@st.fragment
+def history_fragment(default_company, show_benchmark):
+    with profiler.section("history"):
+        st.markdown("### Company History")
+        col_company, col_resolution = st.columns([2, 1])
+        with col_company:
+            company = st.text_input("History for", value=default_company, placeholder="Company name as saved")
+        with col_resolution:
+            resolution = st.radio("Resolution", ["Quarterly", "Every analysis"], horizontal=True)
+        if not company:
+            st.caption("Enter a company name to see its saved analyses over time.")
+            return
+
+        conn = get_portfolio_store()
+        if resolution == "Quarterly":
+            rows = store.company_quarterly(conn, company)
+            labels = [row['quarter'] for row in rows]
+        else:
+            rows = store.company_history(conn, company, limit=HISTORY_LIMIT)
+            labels = [row['timestamp'][:16].replace('T', ' ') for row in rows]
+        if not rows:
+            # History matches the saved name exactly; offer close saved names
+            suggestions = store.company_names(conn, company.strip(), limit=8)
+            st.caption(f"No saved analyses for {company}." +
+                       (f" Saved names containing it: {', '.join(suggestions)}" if suggestions else ""))
+            return
+
+        trends = {"Date": labels, "Overall": [row['overall_score'] for row in rows]}
+        for dim, column in zip(DIMENSIONS, store.SCORE_COLUMNS):
+            trends[dim['title']] = [row[column] for row in rows]
+        st.line_chart(trends, x="Date", height=300)
+
+        history = [(label, [row[c] for c in store.SCORE_COLUMNS]) for label, row in zip(labels, rows)]
+        st.plotly_chart(create_radar_animation(history, show_benchmark), use_container_width=True)
+
+def dimension_card(dim_idx):
+    dim = DIMENSIONS[dim_idx]
+    score_key = f"score_{dim['id']}"
+    percentile = ordinal(cohort_ranks[dim_idx]) + " pct" if cohort_ranks is not None else ""
+    
+    with profiler.section("dimension_card"):
+        # Color-coded header bar and question, rendered from a per-process template
+        st.markdown(card_header_html(dim_idx, st.session_state[score_key], percentile), unsafe_allow_html=True)
+        
+        # Slider
+        st.slider(
+            f"Score for {dim['title']}", 
+            0, 100, 
+            key=score_key, 
+            label_visibility="collapsed"
+        )
+        if st.session_state.uncertainty_mode:
+            st.session_state[f"spread_slider_{dim['id']}"] = st.session_state[f"spread_{dim['id']}"]
+            st.slider(f"± range for {dim['title']}", 0, 50, key=f"spread_slider_{dim['id']}",
+                      on_change=store_spread, args=(dim['id'],),
+                      help="How far the true score could plausibly be from the slider value")
+        
+        # Labels
+        band = cohort_bands[dim_idx] if cohort_bands is not None else None
+        st.markdown(card_labels_html(dim_idx, band), unsafe_allow_html=True)
+        
+    dimension_notes(dim_idx)
+
+@st.fragment
+def dimension_notes(dim_idx):
+    dim = DIMENSIONS[dim_idx]
+    note_key = f"note_{dim['id']}"
+    st.session_state.analysis_snapshot['notes'][dim_idx] = st.session_state[note_key]
+    history = st.session_state.edit_history
+    buttons = (history.can_undo, history.can_redo)
+    history.record({note_key: st.session_state[note_key]})
+    autosave_draft(st.session_state.analysis_snapshot)
+    if (history.can_undo, history.can_redo) != buttons:
+        # The sidebar Undo/Redo buttons are outside this fragment
+        st.rerun()
+    
+    with profiler.section("dimension_notes"):
+        # Expander for rubric and notes
+        with st.expander("View Rubric & Add Notes"):
+            st.markdown(rubric_html(dim_idx), unsafe_allow_html=True)
+            st.text_area(
+                "Notes", 
+                key=note_key, 
+                height=100, 
+                placeholder="Document your reasoning and evidence for this score...",
+                label_visibility="collapsed"
+            )
+        
+        st.markdown("")
+
 # --- MAIN CONTENT ---
 st.title("Fintech IMPACT Radar")
 st.markdown("A comprehensive framework for evaluating fintech innovation and disruption potential")
@@ -600,35 +698,13 @@ st.markdown("")
 col1, col2 = st.columns([1.5, 1])
 
 with col1:
-    st.markdown("### Radar Visualization")
-    radar_fig = create_radar_chart(current_scores, show_benchmark)
-    st.plotly_chart(radar_fig, use_container_width=True)
+    radar_chart_section(current_scores, show_benchmark, peer_count, portfolio_filter, portfolio_size)
 
 with col2:
-    st.markdown("### Overall Assessment")
-    
-    score_class = get_score_class(avg_score)
-    st.markdown(f"""
-        <div class='score-display {score_class}'>
-            {avg_score} / 100
-        </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown(f"**Classification:** {get_score_label(avg_score)}")
-    
-    st.markdown("")
-    st.markdown("**Dimension Scores:**")
-    
-    for dim in DIMENSIONS:
-        score = st.session_state[f"score_{dim['id']}"]
-        
-        col_icon, col_name, col_score = st.columns([0.5, 3, 1])
-        with col_icon:
-            st.markdown(f"<div style='color: {dim['color']}; font-size: 1.2rem;'>{dim['icon']}</div>", unsafe_allow_html=True)
-        with col_name:
-            st.markdown(f"**{dim['title']}**")
-        with col_score:
-            st.markdown(f"<span style='color: {dim['color']}; font-weight: 700;'>{score}</span>", unsafe_allow_html=True)
+    summary_section(current_scores)
+
+if uncertainty_mode:
+    uncertainty_section(current_scores, [st.session_state[f"spread_{d['id']}"] for d in DIMENSIONS])
 
 st.markdown("---")
 
@@ -639,89 +715,43 @@ st.markdown("Score each dimension from 0 (low) to 100 (high) based on the eviden
 st.markdown("")
 
 # Create 2x3 grid
-for row in range(3):
-    cols = st.columns(2)
-    for col_idx in range(2):
-        dim_idx = row * 2 + col_idx
-        if dim_idx < len(DIMENSIONS):
-            dim = DIMENSIONS[dim_idx]
-            
-            with cols[col_idx]:
-                # Color-coded header bar
-                st.markdown(f"""
-                    <div style='background: {dim['lightColor']}; padding: 0.75rem 1rem; 
-                                border-radius: 8px 8px 0 0; border-left: 4px solid {dim['color']};'>
-                        <div style='display: flex; justify-content: space-between; align-items: center;'>
-                            <div>
-                                <div style='font-size: 1.1rem; font-weight: 600; color: #2d3748;'>
-                                    {dim['icon']} {dim['title']}
-                                </div>
-                                <div style='font-size: 0.85rem; color: #6c757d; margin-top: 0.15rem;'>
-                                    {dim['subtitle']}
-                                </div>
-                            </div>
-                            <div style='font-size: 1.5rem; font-weight: 700; color: {dim['color']};'>
-                                {st.session_state[f"score_{dim['id']}"]}
-                            </div>
-                        </div>
-                    </div>
-                    <div style='background: white; border: 1px solid #e9ecef; 
-                                border-top: none; border-radius: 0 0 8px 8px; padding: 1rem;'>
-                """, unsafe_allow_html=True)
-                
-                st.markdown(f"<div class='dimension-question'>{dim['question']}</div>", unsafe_allow_html=True)
-                
-                # Slider
-                st.slider(
-                    f"Score for {dim['title']}", 
-                    0, 100, 
-                    key=f"score_{dim['id']}", 
-                    label_visibility="collapsed"
-                )
-                
-                # Labels
-                l, r = st.columns(2)
-                with l:
-                    st.markdown(f"<div class='slider-label'>← {dim['leftLabel']}</div>", unsafe_allow_html=True)
-                with r:
-                    st.markdown(f"<div class='slider-label' style='text-align: right;'>{dim['rightLabel']} →</div>", unsafe_allow_html=True)
-                
-                # Expander for rubric and notes
-                with st.expander("View Rubric & Add Notes"):
-                    st.markdown("**Scoring Rubric**")
-                    st.markdown(f"""
-                    <table class="rubric-table">
-                        <tr>
-                            <td class="rubric-header">Low (0-30)</td>
-                            <td>{dim['rubric']['low']}</td>
-                        </tr>
-                        <tr>
-                            <td class="rubric-header">Medium (31-70)</td>
-                            <td>{dim['rubric']['medium']}</td>
-                        </tr>
-                        <tr>
-                            <td class="rubric-header">High (71-100)</td>
-                            <td>{dim['rubric']['high']}</td>
-                        </tr>
-                    </table>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("")
-                    st.markdown("**Evidence & Notes**")
-                    st.text_area(
-                        "Notes", 
-                        key=f"note_{dim['id']}", 
-                        height=100, 
-                        placeholder="Document your reasoning and evidence for this score...",
-                        label_visibility="collapsed"
-                    )
-                
-                st.markdown("</div></div>", unsafe_allow_html=True)
-                st.markdown("")
+with profiler.section("dimension_grid"):
+    for row in range(3):
+        cols = st.columns(2)
+        for col_idx in range(2):
+            dim_idx = row * 2 + col_idx
+            if dim_idx < len(DIMENSIONS):
+                with cols[col_idx]:
+                    dimension_card(dim_idx)
+
+if leaderboard_mode:
+    st.markdown("---")
+    leaderboard_fragment()
+
+if frameworks_mode:
+    st.markdown("---")
+    frameworks_fragment(current_scores)
+
+if history_mode:
+    st.markdown("---")
+    history_fragment(st.session_state.company_name, show_benchmark)
 
 st.markdown("---")
 st.markdown(f"""
 <div style='text-align: center; color: #6c757d; padding: 1rem;'>
     <p style='margin: 0; font-size: 0.9rem;'>Fintech IMPACT Radar | Analysis Date: {datetime.now().strftime("%Y-%m-%d")}</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+profiler.record("rerun_total", time.perf_counter() - rerun_start)
+
+if st.query_params.get("profile") == "1":
+    with st.sidebar.expander("Rerun Profiler", expanded=True):
+        st.dataframe(
+            [{'section': name, **stats} for name, stats in sorted(profiler.summary().items())],
+            hide_index=True,
+            column_config={k: st.column_config.NumberColumn(format="%.1f") for k in ('sum_ms', 'last_ms', 'p50_ms', 'p95_ms', 'p99_ms')}
+        )
+        st.download_button("Export Timings (JSON)", profiler.to_json(), "impact_profile.json", "application/json", use_container_width=True)
+        st.download_button("Export Timings (Prometheus)", profiler.to_prometheus(), "impact_profile.prom", "text/plain", use_container_width=True)
+        st.button("Reset Timings", on_click=profiler.reset, use_container_width=True)
@@ -0,0 +1,101 @@
+"""Throughput and latency of the local HTTP API (impact.api).
+
+Starts `python -m impact.api` on a free port and drives it with
+keep-alive asyncio connections for a fixed duration per endpoint.
+Client and server share the machine, so on one core the client's own
+cost is included in the numbers.
+
+    python benchmarks/bench_api.py [--seconds 5] [--connections 8] [--workers 1]
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from impact.core import DIMENSION_IDS, build_analysis
+from impact.profiling import percentile
+from streamlit_client import free_port
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def flat_record(rng, i):
+    return {'company_name': f"Company {i}", **{d: rng.randint(0, 100) for d in DIMENSION_IDS}}
+
+def cases(rng):
+    # (label, path, body, analyses per request)
+    yield 'score', '/score', flat_record(rng, 0), 1
+    yield 'score/batch x100', '/score/batch', [flat_record(rng, i) for i in range(100)], 100
+    yield 'score/batch x1000', '/score/batch', [flat_record(rng, i) for i in range(1000)], 1000
+    doc = build_analysis("Company", [rng.randint(0, 100) for _ in DIMENSION_IDS],
+                         ["Evidence notes. " * 40] * len(DIMENSION_IDS))
+    yield 'report', '/report', doc, 1
+    yield 'report/batch x50', '/report/batch', [doc] * 50, 50
+
+async def connection(port, request, deadline, latencies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        writer.write(request)
+        head = await reader.readuntil(b'\r\n\r\n')
+        if not head.startswith(b'HTTP/1.1 200'):
+            raise RuntimeError(head.split(b'\r\n', 1)[0].decode())
+        length = int(next(
+            line.split(b':', 1)[1] for line in head.split(b'\r\n') if line.lower().startswith(b'content-length')
+        ))
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+async def drive(port, path, body, seconds, connections):
+    payload = json.dumps(body).encode()
+    request = (f"POST {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: application/json\r\n"
+               f"Content-Length: {len(payload)}\r\n\r\n").encode() + payload
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(connection(port, request, start + seconds, latencies) for _ in range(connections)))
+    return time.perf_counter() - start, sorted(latencies)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--connections', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=1, help="server report worker processes")
+    args = parser.parse_args(argv)
+
+    port = free_port()
+    proc = subprocess.Popen([sys.executable, '-m', 'impact.api', '--port', str(port), '-w', str(args.workers)],
+                            cwd=ROOT)
+    try:
+        deadline = time.time() + 30
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1)
+                break
+            except OSError:
+                if time.time() > deadline or proc.poll() is not None:
+                    raise RuntimeError("impact.api did not start")
+                time.sleep(0.2)
+
+        rng = random.Random(0)
+        print(f"{'endpoint':<20} {'req/s':>9} {'analyses/s':>11} {'p50 ms':>8} {'p99 ms':>8}")
+        for label, path, body, per_request in cases(rng):
+            # Short warmup (starts report workers, fills caches)
+            asyncio.run(drive(port, path, body, 0.5, args.connections))
+            elapsed, latencies = asyncio.run(drive(port, path, body, args.seconds, args.connections))
+            rps = len(latencies) / elapsed
+            print(f"{label:<20} {rps:>9,.0f} {rps * per_request:>11,.0f} "
+                  f"{percentile(latencies, 0.5) * 1000:>8.2f} {percentile(latencies, 0.99) * 1000:>8.2f}")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+if __name__ == '__main__':
+    main()
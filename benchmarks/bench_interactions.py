@@ -0,0 +1,55 @@
+"""Server time and websocket bytes per interaction against a live app.
+
+Starts `streamlit run` headless for each app file given (default: app.py)
+and drives it with the protobuf client in streamlit_client.py, so
+fragment-scoped reruns are measured exactly as a browser triggers them.
+
+    python benchmarks/bench_interactions.py [app.py ...] [--rounds 20]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from streamlit_client import StreamlitSession, serve_app
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def interactions(session, rounds):
+    yield 'slider move', lambda i: session.set_value('score_integration', (i * 7) % 101)
+    yield 'note edit', lambda i: session.set_value('note_integration', 'Open banking APIs. ' * (i + 1))
+    yield 'company name', lambda i: session.set_value('company_name', f"Company {i}")
+
+def bench_app(app_path, rounds):
+    with tempfile.TemporaryDirectory() as tmp, \
+            serve_app(app_path, env={'IMPACT_DB_PATH': str(Path(tmp) / 'bench.db')}) as (url, _):
+        session = StreamlitSession(url)
+        rows = []
+        for name, action in interactions(session, rounds):
+            stats = [action(i) for i in range(rounds)]
+            rows.append((
+                name,
+                statistics.median(s.seconds for s in stats) * 1000,
+                statistics.median(s.bytes for s in stats) / 1024,
+                statistics.median(s.deltas for s in stats),
+            ))
+        session.close()
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('apps', nargs='*', default=[str(ROOT / 'app.py')])
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    for app_path in args.apps:
+        print(f"\n{app_path}")
+        print(f"{'interaction':<14} {'server ms':>10} {'ws KB':>8} {'deltas':>7}")
+        for name, ms, kb, deltas in bench_app(app_path, args.rounds):
+            print(f"{name:<14} {ms:>10.1f} {kb:>8.1f} {deltas:>7.0f}")
+
+if __name__ == '__main__':
+    main()
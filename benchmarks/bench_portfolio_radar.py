@@ -0,0 +1,64 @@
+"""Serialized size and build time of the portfolio radar against trace count.
+
+Compares a naive figure (one fully styled, filled go.Scatterpolar per
+company, as create_radar_chart draws a single analysis) with the cached
+slim spec from impact.charts.create_portfolio_radar_spec.
+
+    python benchmarks/bench_portfolio_radar.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from impact.charts import create_portfolio_radar_spec, overlay_current_analysis, radar_layout
+from impact.core import DIMENSIONS
+
+TRACE_COUNTS = [10, 100, 500, 1000]
+
+def naive_figure(portfolio):
+    categories = [d['title'] for d in DIMENSIONS]
+    theta = categories + [categories[0]]
+    fig = go.Figure()
+    for label, values in portfolio:
+        fig.add_trace(go.Scatterpolar(
+            r=list(values) + [values[0]], theta=theta, fill='toself', name=label,
+            line=dict(color='#0d6efd', width=2), fillcolor='rgba(13, 110, 253, 0.2)',
+            marker=dict(size=8, color='#0d6efd')
+        ))
+    fig.update_layout(**radar_layout())
+    return fig
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    rng = random.Random(0)
+    current = [50] * len(DIMENSIONS)
+    print(f"{'traces':>7} | {'naive build':>11} {'naive KB':>9} | {'slim build':>10} {'rerun':>8} {'slim KB':>8}")
+    for n in TRACE_COUNTS:
+        portfolio = [(f"Company {i}", [rng.randint(0, 100) for _ in DIMENSIONS]) for i in range(n)]
+
+        naive_s, naive = timed(lambda: naive_figure(portfolio))
+        naive_kb = len(pio.to_json(naive, validate=False)) / 1024
+
+        slim_s, spec = timed(lambda: create_portfolio_radar_spec(portfolio))
+        # Per-rerun cost once the spec is cached: overlay + what st.plotly_chart does
+        rerun_s, fig = timed(lambda: pio.to_json(overlay_current_analysis(spec, current).to_dict(), validate=False))
+        slim_kb = len(fig) / 1024
+
+        print(f"{n:>7} | {naive_s * 1000:>9.1f}ms {naive_kb:>9.1f} | "
+              f"{slim_s * 1000:>8.1f}ms {rerun_s * 1000:>6.1f}ms {slim_kb:>8.1f}")
+
+if __name__ == '__main__':
+    main()
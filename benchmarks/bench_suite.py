@@ -0,0 +1,207 @@
+"""Benchmarks for the scoring, chart and export hot paths.
+
+Runs the score helpers, export_json, generate_word_doc and
+build_radar_chart over batches of 1/100/10k analyses, with empty notes
+and with 10 KB of notes per dimension. Each case records wall time,
+tracemalloc peak allocation and output size. Results can be saved as JSON
+and a later run diffed against them.
+
+    python benchmarks/bench_suite.py --save-json before.json
+    python benchmarks/bench_suite.py --baseline before.json --tolerance 0.1
+    python benchmarks/bench_suite.py --only word_doc --batches 1 100
+
+Reports render each distinct radar image once into a temporary chart cache,
+so word_doc best-of times are warm-cache times. Radar charts and the first
+render of report images take ms each, so their 10k batches only run with
+--full.
+Times are the best of several runs; on a shared or throttled host, diff
+with a looser --tolerance.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('IMPACT_CHART_CACHE', tempfile.mkdtemp(prefix='impact_charts_'))
+
+import plotly.io as pio
+
+from impact.charts import build_radar_chart
+from impact.core import (
+    DIMENSIONS, count_high_scores, export_json, get_score_class, get_score_color,
+    get_score_label, overall_score,
+)
+from impact.reports import generate_word_doc
+
+BATCHES = [1, 100, 10_000]
+NOTE_SIZES = {'empty': 0, '10kb': 10 * 1024}
+HEAVY_BATCH = 1000
+WORDS = ("open banking api licence churn interchange kyc ledger payout underwriting "
+         "B2B & SME <lending> margin embedded finance 'card' issuing").split()
+
+# --- Inputs ---
+def make_note(rng, size):
+    if not size:
+        return ''
+    parts, length = [], 0
+    while length < size:
+        sentence = ' '.join(rng.choices(WORDS, k=rng.randint(6, 18))).capitalize() + '.'
+        if rng.random() < 0.1:
+            sentence += '\n\t- ' + rng.choice(WORDS)
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return ' '.join(parts)[:size]
+
+def make_analyses(n, note_size, seed=0):
+    rng = random.Random(seed)
+    # A small pool of distinct notes keeps 10k x 10 KB inputs from dominating memory
+    notes_pool = [make_note(rng, note_size) for _ in range(min(n * len(DIMENSIONS), 64))]
+    return [(
+        f"Company {i}",
+        [rng.randint(0, 100) for _ in DIMENSIONS],
+        [rng.choice(notes_pool) for _ in DIMENSIONS],
+        datetime(2024, 1, 1).isoformat(),
+    ) for i in range(n)]
+
+# --- Cases ---
+# Each runner takes a batch of analyses and returns total output bytes
+def run_score_helpers(batch):
+    size = 0
+    for _, scores, _, _ in batch:
+        avg = overall_score(scores)
+        size += len(get_score_label(avg)) + count_high_scores(scores)
+        for score in scores:
+            size += len(get_score_color(score)) + len(get_score_class(score))
+    return size
+
+def run_export_json(batch):
+    return sum(len(export_json(name, scores, notes, ts).encode('utf-8'))
+               for name, scores, notes, ts in batch)
+
+def run_word_doc(batch):
+    return sum(generate_word_doc(name, overall_score(scores), ts, scores, notes).getbuffer().nbytes
+               for name, scores, notes, ts in batch)
+
+def run_radar_chart(batch):
+    # Uncached build (create_radar_chart memoizes per score vector) plus the
+    # to_dict/to_json that st.plotly_chart does on every rerun
+    return sum(len(pio.to_json(build_radar_chart(scores, True).to_dict(), validate=False))
+               for _, scores, _, _ in batch)
+
+# name -> (runner, whether notes affect it, heavy)
+CASES = {
+    'score_helpers': (run_score_helpers, False, False),
+    'export_json': (run_export_json, True, False),
+    'word_doc': (run_word_doc, True, True),
+    'radar_chart': (run_radar_chart, False, True),
+}
+
+def measure(runner, batch, repeat, min_seconds=0.2):
+    # Repeat small batches until min_seconds has passed so the best time is stable
+    times = []
+    while len(times) < repeat or sum(times) < min_seconds:
+        start = time.perf_counter()
+        output_bytes = runner(batch)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    runner(batch)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    n = len(batch)
+    return {
+        'batch': n,
+        'repeat': len(times),
+        'median_s': statistics.median(times),
+        'min_s': min(times),
+        'per_item_us': min(times) / n * 1e6,
+        'peak_alloc_kb': peak / 1024,
+        'output_bytes_per_item': output_bytes / n,
+    }
+
+def run_suite(batches, only=None, full=False, repeat=5):
+    # Warm lazy imports and caches (plotly, the compiled report template)
+    warm = make_analyses(1, 0)
+    for runner, _, _ in CASES.values():
+        runner(warm)
+
+    results = {}
+    for name, (runner, uses_notes, heavy) in CASES.items():
+        if only and name not in only:
+            continue
+        for note_label, note_size in NOTE_SIZES.items() if uses_notes else [('-', 0)]:
+            for n in batches:
+                key = f"{name}[notes={note_label},batch={n}]" if uses_notes else f"{name}[batch={n}]"
+                if heavy and n > HEAVY_BATCH and not full:
+                    print(f"{key:<42} skipped (use --full)")
+                    continue
+                batch = make_analyses(n, note_size)
+                results[key] = measure(runner, batch, repeat if n < 10_000 else max(1, repeat // 2))
+                r = results[key]
+                print(f"{key:<42} {r['median_s'] * 1000:>10.2f} ms {r['per_item_us']:>10.1f} us/item "
+                      f"{r['peak_alloc_kb']:>10.1f} KB peak {r['output_bytes_per_item']:>10.0f} B/item")
+    return results
+
+# --- Baseline Diff ---
+def compare(results, baseline, tolerance):
+    regressions = []
+    print(f"\n{'case':<42} {'time':>8} {'alloc':>8} {'output':>8}")
+    for key, r in results.items():
+        base = baseline.get(key)
+        if not base:
+            print(f"{key:<42} {'new':>8}")
+            continue
+        ratios = [
+            r['per_item_us'] / base['per_item_us'] if base['per_item_us'] else 1.0,
+            r['peak_alloc_kb'] / base['peak_alloc_kb'] if base['peak_alloc_kb'] else 1.0,
+            r['output_bytes_per_item'] / base['output_bytes_per_item'] if base['output_bytes_per_item'] else 1.0,
+        ]
+        print(f"{key:<42} " + " ".join(f"{x:>7.2f}x" for x in ratios))
+        for label, ratio in zip(('time', 'alloc', 'output'), ratios):
+            if ratio > 1 + tolerance:
+                regressions.append(f"{key} {label} {ratio:.2f}x baseline")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the IMPACT scoring, chart and export hot paths.")
+    parser.add_argument('--batches', type=int, nargs='+', default=BATCHES)
+    parser.add_argument('--only', nargs='+', choices=list(CASES))
+    parser.add_argument('--full', action='store_true', help="include heavy cases at large batch sizes")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save-json')
+    parser.add_argument('--baseline', help="JSON from a previous --save-json run to diff against")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed regression vs baseline")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.batches, args.only, args.full, args.repeat)
+
+    if args.save_json:
+        Path(args.save_json).write_text(json.dumps({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'results': results,
+        }, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"FAIL: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Incremental leaderboard orders match a full rebuild (impact.leaderboard).
+
+Feeds random analyses to one Leaderboard in slices, so every sort order
+is extended with merge_order, and after each slice compares every order
+and a sample of filtered pages with a Leaderboard built from scratch on
+the same rows, and with a stable argsort of the sort values. Scores are
+drawn from a narrow range and names from a small pool, so ties and new
+distinct names happen at most cut points.
+
+    python benchmarks/check_leaderboard.py [--rows 20000] [--cuts 7] [--seed 0]
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from impact.batch import CLASS_LABELS
+from impact.core import DIMENSION_IDS
+from impact.leaderboard import SORT_KEYS, Leaderboard
+
+def random_rows(rng, n):
+    names = [f"Company {rng.randint(0, n // 20)}{rng.choice(['', ' Ltd', ' AG'])}" for _ in range(n)]
+    timestamps = [f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00" for _ in range(n)]
+    vectors = np.array([[rng.randint(40, 60) for _ in DIMENSION_IDS] for _ in range(n)], dtype=np.float32)
+    ids = np.arange(1, n + 1, dtype=np.int64)
+    return ids, np.array(names, dtype=object), np.array(timestamps, dtype=object), vectors
+
+def compare(incremental, full, rng):
+    for key in SORT_KEYS:
+        expected = np.argsort(full.sort_values(key), kind='stable')
+        for board in (incremental, full):
+            if not np.array_equal(board._orders[key], expected):
+                return f"order '{key}' differs from a stable argsort"
+        for descending in (False, True):
+            classification = rng.choice([None, *CLASS_LABELS.tolist()])
+            search = rng.choice(['', 'ltd', 'company 1'])
+            page = rng.randint(0, 3)
+            a = incremental.page(key, descending, classification, search, page, 25)
+            b = full.page(key, descending, classification, search, page, 25)
+            if a != b:
+                return f"page {page} of '{key}' ({classification}, {search!r}) differs"
+    return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--cuts', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    ids, names, timestamps, vectors = random_rows(rng, args.rows)
+    cuts = sorted(rng.sample(range(1, args.rows), args.cuts)) + [args.rows]
+
+    incremental = Leaderboard()
+    for n in cuts:
+        incremental.update(ids[:n], names[:n], timestamps[:n], vectors[:n])
+        full = Leaderboard()
+        full.update(ids[:n], names[:n], timestamps[:n], vectors[:n])
+        error = compare(incremental, full, rng)
+        print(f"{n:>8} rows: {error or 'match'}")
+        if error:
+            return 1
+    print(f"All {len(SORT_KEYS)} orders matched a full rebuild at {len(cuts)} cut points.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Template-rendered DOCX reports match python-docx built ones (impact.reports).
+
+generate_word_doc fills {{tokens}} into a precompiled document.xml. This
+rebuilds each report the way it used to be made, paragraph by paragraph
+with python-docx (plus the radar picture, added the same way), and
+compares both documents read back with python-docx: every paragraph's
+style, alignment and text, each run's text and formatting, and the
+embedded chart image. The one intended difference: python-docx turns a
+Windows line ending (CR LF) into two line breaks and the template into
+one, so the reference is given CR LF as LF.
+
+    python benchmarks/check_reports.py [--random 50] [--seed 0]
+"""
+import argparse
+import random
+import sys
+from io import BytesIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from impact.core import DIMENSIONS, get_score_label, overall_score
+from impact.radar_image import radar_png
+from impact.reports import CHART_WIDTH_INCHES, generate_word_doc
+
+def reference_word_doc(company_name, avg_score, timestamp, scores, notes, show_benchmark=True):
+    # The python-docx generator generate_word_doc replaced, plus the chart
+    from docx import Document
+    from docx.shared import Inches, Pt, RGBColor
+
+    doc = Document()
+
+    heading = doc.add_heading('FINTECH IMPACT RADAR ANALYSIS', 0)
+    heading.alignment = 1
+
+    doc.add_paragraph()
+    p = doc.add_paragraph()
+    run = p.add_run(f"Company: {company_name if company_name else 'Not specified'}")
+    run.bold = True
+    run.font.size = Pt(14)
+
+    p2 = doc.add_paragraph()
+    run2 = p2.add_run(f"Analysis Date: {timestamp}")
+    run2.font.size = Pt(10)
+    run2.font.color.rgb = RGBColor(108, 117, 125)
+
+    doc.add_heading(f'Overall IMPACT Score: {avg_score}/100', level=1)
+    p3 = doc.add_paragraph(f"Assessment: {get_score_label(avg_score)}")
+    p3.runs[0].italic = True
+
+    doc.add_picture(BytesIO(radar_png(scores, show_benchmark)), width=Inches(CHART_WIDTH_INCHES))
+    doc.paragraphs[-1].alignment = 1
+
+    doc.add_page_break()
+
+    for dim, score, note in zip(DIMENSIONS, scores, notes):
+        doc.add_heading(f"{dim['icon']} {dim['title']} - {score}/100", level=2)
+        doc.add_paragraph(f"Focus: {dim['subtitle']}")
+        doc.add_paragraph(f"Key Question: {dim['question']}")
+
+        doc.add_heading('Scoring Rubric:', level=3)
+        doc.add_paragraph(f"Low (0-30): {dim['rubric']['low']}")
+        doc.add_paragraph(f"Medium (31-70): {dim['rubric']['medium']}")
+        doc.add_paragraph(f"High (71-100): {dim['rubric']['high']}")
+
+        doc.add_heading('Analysis & Evidence:', level=3)
+        doc.add_paragraph(note.replace('\r\n', '\n') if note else "No notes recorded.")
+
+        doc.add_paragraph("_" * 70)
+
+    buffer = BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+def describe(buffer):
+    from docx import Document
+
+    doc = Document(buffer)
+    paragraphs = []
+    for p in doc.paragraphs:
+        runs = [(r.text, r.bold, r.italic, r.font.size, r.font.color.rgb if r.font.color.type else None)
+                for r in p.runs]
+        paragraphs.append((p.style.name, p.alignment, p.text, runs))
+    images = [rel.target_part.blob for rel in doc.part.rels.values() if rel.reltype.endswith('/image')]
+    return paragraphs, images
+
+def compare(args):
+    expected = describe(reference_word_doc(*args))
+    actual = describe(generate_word_doc(*args))
+    if len(expected[0]) != len(actual[0]):
+        return f"{len(actual[0])} paragraphs, expected {len(expected[0])}"
+    for i, (e, a) in enumerate(zip(expected[0], actual[0])):
+        if e != a:
+            return f"paragraph {i} differs:\n  expected {e!r}\n  got      {a!r}"
+    if expected[1] != actual[1]:
+        return "embedded chart image differs"
+    return None
+
+def cases(rng, count):
+    markup = "<b>&amp; \"quotes\" 'single' ]]> {{score_integration}} é 🙂"
+    yield "Fixed notes", [50] * 6, [""] * 6
+    yield "", [0, 100, 30, 31, 70, 71], ["x"] * 6
+    yield markup, [rng.randint(0, 100) for _ in DIMENSIONS], [markup] * 6
+    yield "Lines & tabs", [42] * 6, ["line 1\nline 2\n\n\tindented", "trailing\n", "\tlead", "crlf\r\nand\rcr", "a\tb\tc", "\n"]
+    yield "Long notes", [rng.randint(0, 100) for _ in DIMENSIONS], ["Evidence notes. " * 640] * 6
+    alphabet = "abc XYZ 0123 .,;:!?<>&\"'\n\r\té€🙂"
+    for i in range(count):
+        notes = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 300))) for _ in DIMENSIONS]
+        yield f"Company {i} <{rng.choice(alphabet)}>", [rng.randint(0, 100) for _ in DIMENSIONS], notes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--random', type=int, default=50, help="random documents after the fixed cases")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    checked = 0
+    for company_name, scores, notes in cases(rng, args.random):
+        for show_benchmark in (True, False):
+            report = (company_name, overall_score(scores), "2025-01-31 09:30", scores, notes, show_benchmark)
+            error = compare(report)
+            if error:
+                print(f"{company_name[:40]!r}: {error}")
+                return 1
+            checked += 1
+    print(f"All {checked} reports matched the python-docx build paragraph for paragraph.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Undo/redo restores every recorded state exactly (impact.undo).
+
+Two checks on random data:
+
+- text_delta / apply_text_delta round-trip random edits of random text,
+  including repeated characters, where prefix and suffix overlap.
+- A random sequence of edit sets (note insertions, deletions and
+  replacements, score moves, company renames) interleaved with undo,
+  redo and fresh edits after an undo. Every state reached is compared
+  with the one recorded for that history position.
+
+    python benchmarks/check_undo.py [--texts 20000] [--sessions 2000] [--steps 60] [--seed 0]
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from impact.undo import EditHistory, apply_text_delta, text_delta
+
+ALPHABET = "aab \n{}<&é🙂"
+
+def random_text(rng, max_length):
+    return ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+def edit_text(rng, text):
+    start = rng.randint(0, len(text))
+    end = rng.randint(start, min(len(text), start + rng.randint(0, 8)))
+    return text[:start] + random_text(rng, 6) + text[end:]
+
+def check_text_deltas(rng, count):
+    for _ in range(count):
+        old = random_text(rng, 40)
+        new = edit_text(rng, old) if rng.random() < 0.8 else random_text(rng, 40)
+        start, removed, inserted = text_delta(old, new)
+        if old[start:start + len(removed)] != removed:
+            return f"text_delta({old!r}, {new!r}) removed span is wrong"
+        if apply_text_delta(old, start, removed, inserted) != new:
+            return f"text_delta({old!r}, {new!r}) does not redo"
+        if apply_text_delta(new, start, inserted, removed) != old:
+            return f"text_delta({old!r}, {new!r}) does not undo"
+    return None
+
+def random_edit(rng, state):
+    values = dict(state)
+    for key in rng.sample(sorted(values), rng.randint(1, 3)):
+        if key.startswith('score_'):
+            values[key] = rng.randint(0, 100)
+        else:
+            values[key] = edit_text(rng, values[key])
+    return values
+
+def check_session(rng, steps, max_entries):
+    history = EditHistory(max_entries=max_entries)
+    state = {'company_name': random_text(rng, 10), 'score_a': 50, 'score_b': 50,
+             'note_a': random_text(rng, 30), 'note_b': ''}
+    history.record(state)
+    # states[i] is the state after i undoable entries; position is the current one
+    states, position = [dict(state)], 0
+    for step in range(steps):
+        action = rng.random()
+        if action < 0.25 and history.can_undo:
+            state.update(history.undo())
+            position -= 1
+        elif action < 0.4 and history.can_redo:
+            state.update(history.redo())
+            position += 1
+        else:
+            state = random_edit(rng, state)
+            if history.record(state):
+                states[position + 1:] = [dict(state)]
+                position += 1
+        if state != states[position] or history.state != states[position]:
+            return f"step {step}: state differs from the recorded state at position {position}"
+        # Dropped entries only limit how far back undo goes
+        if len(history) > position or history.can_undo != (len(history) > 0):
+            return f"step {step}: undo stack is longer than the recorded history"
+        if history.can_redo != (position < len(states) - 1):
+            return f"step {step}: can_redo disagrees with the recorded history"
+    return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--texts', type=int, default=20000)
+    parser.add_argument('--sessions', type=int, default=2000)
+    parser.add_argument('--steps', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    error = check_text_deltas(rng, args.texts)
+    print(f"text deltas: {error or f'{args.texts} random edits round-trip'}")
+    if error:
+        return 1
+    for i in range(args.sessions):
+        # Small max_entries in some sessions so dropping old entries is covered
+        error = check_session(rng, args.steps, rng.choice([5, 20, 500]))
+        if error:
+            print(f"session {i}: {error}")
+            return 1
+    print(f"edit history: {args.sessions} sessions x {args.steps} steps matched every recorded state")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
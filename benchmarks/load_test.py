@@ -0,0 +1,185 @@
+"""Concurrent-session load test for app.py.
+
+Starts the app headless on a local port and drives N concurrent sessions
+over the Streamlit websocket protocol with a seeded, realistic mix of
+slider moves, note typing, export downloads and Reset Analysis clicks.
+Reports throughput, rerun latency percentiles and server memory per
+session, and exits non-zero when a threshold or baseline is exceeded.
+
+    python benchmarks/load_test.py --sessions 50 --actions 40
+    python benchmarks/load_test.py --sessions 20 --max-p95-ms 500 --save-json load.json
+    python benchmarks/load_test.py --sessions 20 --baseline load.json --tolerance 0.25
+
+Runs offline on a single Linux box (memory is read from /proc).
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from impact.core import DIMENSION_IDS
+from impact.profiling import percentile
+from streamlit_client import DownloadExpired, StreamlitSession, serve_app
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ACTION_WEIGHTS = {'slider': 50, 'note': 30, 'export': 15, 'reset': 5}
+NOTE_WORDS = "open banking api licence churn interchange kyc ledger payout underwriting".split()
+
+def rss_mb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def run_session(url, actions, seed, think_s, results):
+    rng = random.Random(seed)
+    session = StreamlitSession(url)
+    notes = {d: '' for d in DIMENSION_IDS}
+    names, weights = zip(*ACTION_WEIGHTS.items())
+    samples = []
+    errors = expired = 0
+    for _ in range(actions):
+        action = rng.choices(names, weights)[0]
+        dim = rng.choice(DIMENSION_IDS)
+        try:
+            if action == 'slider':
+                stats = session.set_value(f"score_{dim}", rng.randint(0, 100))
+            elif action == 'note':
+                notes[dim] += ' '.join(rng.choices(NOTE_WORDS, k=rng.randint(3, 12))) + '. '
+                stats = session.set_value(f"note_{dim}", notes[dim])
+            elif action == 'export':
+                stats = session.download(rng.choice(list(session.downloads)))
+            else:
+                notes = {d: '' for d in DIMENSION_IDS}
+                stats = session.click("Reset Analysis")
+            errors += stats.exceptions
+            samples.append((action, stats.seconds))
+        except DownloadExpired:
+            expired += 1
+        except Exception:
+            errors += 1
+        if think_s:
+            time.sleep(think_s)
+    session.close()
+    results.append((samples, errors, expired))
+
+def run_load(app_path, sessions, actions, seed, think_s):
+    with tempfile.TemporaryDirectory() as tmp, \
+            serve_app(app_path, env={'IMPACT_DB_PATH': str(Path(tmp) / 'load.db')}) as (url, proc):
+        # Warm imports and caches so memory per session excludes startup
+        warmup = StreamlitSession(url)
+        warmup.close()
+        time.sleep(0.5)
+        base_rss = rss_mb(proc.pid)
+
+        results = []
+        threads = [
+            threading.Thread(target=run_session, args=(url, actions, seed + i, think_s, results))
+            for i in range(sessions)
+        ]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        peak_rss = base_rss
+        while any(t.is_alive() for t in threads):
+            peak_rss = max(peak_rss, rss_mb(proc.pid))
+            time.sleep(0.1)
+        elapsed = time.perf_counter() - start
+        for t in threads:
+            t.join()
+
+    latencies = sorted(s for samples, _, _ in results for _, s in samples)
+    by_action = {}
+    for samples, _, _ in results:
+        for action, s in samples:
+            by_action.setdefault(action, []).append(s)
+    return {
+        'sessions': sessions,
+        'actions_per_session': actions,
+        'interactions': len(latencies),
+        'errors': sum(e for _, e, _ in results),
+        'expired_downloads': sum(x for _, _, x in results),
+        'seconds': elapsed,
+        'throughput_per_s': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'p95_ms_by_action': {a: percentile(sorted(v), 0.95) * 1000 for a, v in sorted(by_action.items())},
+        'base_rss_mb': base_rss,
+        'peak_rss_mb': peak_rss,
+        'rss_per_session_mb': (peak_rss - base_rss) / sessions,
+    }
+
+def check(result, args):
+    failures = []
+    if result['errors'] > args.max_errors:
+        failures.append(f"{result['errors']} errors > {args.max_errors}")
+    if args.max_expired is not None and result['expired_downloads'] > args.max_expired:
+        failures.append(f"{result['expired_downloads']} expired downloads > {args.max_expired}")
+    if args.max_p95_ms and result['p95_ms'] > args.max_p95_ms:
+        failures.append(f"p95 {result['p95_ms']:.1f} ms > {args.max_p95_ms} ms")
+    if args.min_throughput and result['throughput_per_s'] < args.min_throughput:
+        failures.append(f"throughput {result['throughput_per_s']:.1f}/s < {args.min_throughput}/s")
+    if args.max_session_mb and result['rss_per_session_mb'] > args.max_session_mb:
+        failures.append(f"{result['rss_per_session_mb']:.2f} MB/session > {args.max_session_mb} MB")
+    if args.baseline:
+        base = json.loads(Path(args.baseline).read_text())
+        limit = 1 + args.tolerance
+        if result['p95_ms'] > base['p95_ms'] * limit:
+            failures.append(f"p95 {result['p95_ms']:.1f} ms regressed vs baseline {base['p95_ms']:.1f} ms")
+        if result['throughput_per_s'] * limit < base['throughput_per_s']:
+            failures.append(f"throughput {result['throughput_per_s']:.1f}/s regressed vs "
+                            f"baseline {base['throughput_per_s']:.1f}/s")
+        if result['rss_per_session_mb'] > max(base['rss_per_session_mb'], 0.5) * limit:
+            failures.append(f"{result['rss_per_session_mb']:.2f} MB/session regressed vs "
+                            f"baseline {base['rss_per_session_mb']:.2f} MB")
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the IMPACT app.")
+    parser.add_argument('--app', default=str(ROOT / 'app.py'))
+    parser.add_argument('--sessions', type=int, default=10)
+    parser.add_argument('--actions', type=int, default=30, help="interactions per session")
+    parser.add_argument('--think-ms', type=float, default=0, help="pause between a session's interactions")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-errors', type=int, default=0)
+    parser.add_argument('--max-expired', type=int,
+                        help="fail on export downloads whose file was cleaned up before the fetch")
+    parser.add_argument('--max-p95-ms', type=float)
+    parser.add_argument('--min-throughput', type=float)
+    parser.add_argument('--max-session-mb', type=float)
+    parser.add_argument('--baseline', help="JSON from a previous --save-json run to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed regression vs baseline")
+    parser.add_argument('--save-json')
+    args = parser.parse_args(argv)
+
+    result = run_load(args.app, args.sessions, args.actions, args.seed, args.think_ms / 1000)
+
+    print(f"{result['sessions']} sessions x {result['actions_per_session']} actions "
+          f"in {result['seconds']:.1f}s, {result['errors']} errors, "
+          f"{result['expired_downloads']} expired downloads")
+    print(f"throughput {result['throughput_per_s']:.1f} interactions/s")
+    print(f"latency p50 {result['p50_ms']:.1f} ms  p95 {result['p95_ms']:.1f} ms  p99 {result['p99_ms']:.1f} ms")
+    print("p95 by action: " + ", ".join(f"{a} {ms:.1f} ms" for a, ms in result['p95_ms_by_action'].items()))
+    print(f"server RSS {result['base_rss_mb']:.1f} -> {result['peak_rss_mb']:.1f} MB "
+          f"({result['rss_per_session_mb']:.2f} MB/session)")
+
+    if args.save_json:
+        Path(args.save_json).write_text(json.dumps(result, indent=2))
+
+    failures = check(result, args)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
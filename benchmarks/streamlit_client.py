@@ -0,0 +1,181 @@
+"""Minimal headless Streamlit websocket client for benchmarks.
+
+Speaks the same protobuf protocol as the browser: it sends BackMsg rerun
+requests (fragment-scoped when the widget lives in a fragment) and reads
+ForwardMsg deltas until the run finishes, recording server time and the
+bytes that went over the websocket.
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+@dataclass
+class RerunStats:
+    seconds: float
+    bytes: int
+    messages: int
+    deltas: int
+    exceptions: int = 0
+
+class DownloadExpired(Exception):
+    # The generated file is not referenced by any session, so orphan cleanup
+    # after two script runs (from any session) deletes it; under load that
+    # can happen before the client fetches the URL.
+    pass
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+@contextmanager
+def serve_app(app_path, env=None, port=None):
+    # Runs `streamlit run app_path` headless and yields (base URL, process)
+    port = port or free_port()
+    cmd = [
+        sys.executable, '-m', 'streamlit', 'run', str(app_path),
+        '--server.headless', 'true', '--server.port', str(port),
+        '--server.enableXsrfProtection', 'false', '--browser.gatherUsageStats', 'false',
+    ]
+    proc = subprocess.Popen(cmd, env={**os.environ, **(env or {})},
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f"127.0.0.1:{port}"
+    try:
+        deadline = time.time() + 60
+        while True:
+            try:
+                urllib.request.urlopen(f"http://{base_url}/_stcore/health", timeout=1)
+                break
+            except OSError:
+                if time.time() > deadline or proc.poll() is not None:
+                    raise RuntimeError(f"Streamlit server for {app_path} did not start")
+                time.sleep(0.2)
+        yield base_url, proc
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+class StreamlitSession:
+    def __init__(self, base_url, query_string=''):
+        self.base_url = base_url
+        self.ws = connect(f"ws://{base_url}/_stcore/stream", subprotocols=['streamlit'], max_size=None)
+        self.query_string = query_string
+        self.session_id = ''
+        self.widgets = {}    # key or label -> (widget id, element type, fragment id)
+        self.states = {}     # widget id -> WidgetState
+        self.downloads = {}  # download button label -> deferred file id
+        self.last = self.rerun()
+
+    def close(self):
+        self.ws.close()
+
+    def _track(self, delta):
+        element = delta.new_element
+        kind = element.WhichOneof('type')
+        widget_id = getattr(getattr(element, kind), 'id', '')
+        if not widget_id.startswith('$$ID-'):
+            return
+        if getattr(getattr(element, kind), 'set_value', False):
+            # The script assigned this widget's value (e.g. a reset); the
+            # browser adopts it, so stop sending our stale state.
+            self.states.pop(widget_id, None)
+        key = widget_id.rsplit('-', 1)[-1]
+        entry = (widget_id, kind, delta.fragment_id)
+        if key != 'None':
+            self.widgets[key] = entry
+        label = getattr(getattr(element, kind), 'label', '')
+        if label:
+            self.widgets.setdefault(label, entry)
+        if kind == 'download_button' and element.download_button.deferred_file_id:
+            self.downloads[label] = element.download_button.deferred_file_id
+
+    def rerun(self, fragment_id='', extra_states=()):
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        client_state.query_string = self.query_string
+        client_state.widget_states.widgets.extend(list(self.states.values()) + list(extra_states))
+        if fragment_id:
+            client_state.fragment_id = fragment_id
+
+        start = time.perf_counter()
+        self.ws.send(msg.SerializeToString())
+        total = messages = deltas = exceptions = 0
+        while True:
+            data = self.ws.recv()
+            total += len(data)
+            messages += 1
+            fm = ForwardMsg()
+            fm.ParseFromString(data)
+            kind = fm.WhichOneof('type')
+            if kind == 'new_session':
+                self.session_id = fm.new_session.initialize.session_id
+            elif kind == 'delta':
+                deltas += 1
+                if fm.delta.WhichOneof('type') == 'new_element':
+                    self._track(fm.delta)
+                    exceptions += fm.delta.new_element.WhichOneof('type') == 'exception'
+            elif kind == 'script_finished' and fm.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        return RerunStats(time.perf_counter() - start, total, messages, deltas, exceptions)
+
+    def set_value(self, name, value):
+        widget_id, kind, fragment_id = self.widgets[name]
+        state = WidgetState(id=widget_id)
+        if kind == 'slider':
+            state.double_array_value.data[:] = [value]
+        elif kind in ('checkbox', 'toggle'):
+            state.bool_value = value
+        else:
+            state.string_value = value
+        self.states[widget_id] = state
+        self.last = self.rerun(fragment_id)
+        return self.last
+
+    def click(self, name):
+        widget_id, _, fragment_id = self.widgets[name]
+        self.last = self.rerun(fragment_id, [WidgetState(id=widget_id, trigger_value=True)])
+        return self.last
+
+    def _resolve_download(self, label):
+        msg = BackMsg()
+        request = msg.backend_operation_request
+        request.request_id = uuid.uuid4().hex
+        request.session_id = self.session_id
+        request.deferred_file.file_id = self.downloads[label]
+        self.ws.send(msg.SerializeToString())
+        while True:
+            fm = ForwardMsg()
+            fm.ParseFromString(self.ws.recv())
+            if fm.WhichOneof('type') == 'backend_operation_response' and \
+                    fm.backend_operation_response.request_id == request.request_id:
+                response = fm.backend_operation_response
+                break
+        if response.error_msg:
+            raise RuntimeError(f"Download {label!r} failed: {response.error_msg}")
+        url = response.deferred_file.url
+        return url if url.startswith('http') else f"http://{self.base_url}{url}"
+
+    def download(self, label):
+        # Resolves a deferred download button the way the browser does:
+        # a backend operation returns a media URL, which is then fetched.
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(self._resolve_download(label), timeout=60) as resp:
+                size = len(resp.read())
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                raise DownloadExpired(label) from e
+            raise
+        return RerunStats(time.perf_counter() - start, size, 1, 0)
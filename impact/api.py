@@ -0,0 +1,231 @@
+import argparse
+import asyncio
+import io
+import json
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
+
+import numpy as np
+
+try:
+    import orjson
+    dumps = orjson.dumps
+except ImportError:
+    def dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+from impact.batch import CLASS_LABELS, NAME_COLUMN, RESULT_COLUMNS, score_matrix
+from impact.bulk_reports import render_report
+from impact.core import (
+    DIMENSION_IDS, DIMENSIONS, build_analysis, count_high_scores, get_score_label,
+    overall_score, validate_analysis,
+)
+from impact.loader import loads
+
+DEFAULT_PORT = 8502
+MAX_BODY_BYTES = 64 << 20
+MAX_REPORT_BATCH = 1000
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+UNSAFE_FILENAME_RE = re.compile(r'[^\x20-\x7e]|["\\]')
+
+class BadRequest(ValueError):
+    pass
+
+# --- Request Items ---
+# An item is either an export_json document or a flat record in the batch
+# CLI's format: {"company_name": ..., "<dimension id>": score, ...}.
+def item_scores(item):
+    if not isinstance(item, dict):
+        raise BadRequest("each analysis must be a JSON object")
+    if 'dimensions' in item:
+        company_name, scores, _, _ = validate_analysis(item)
+        return company_name, scores
+    scores = [item.get(d) for d in DIMENSION_IDS]
+    for dim_id, score in zip(DIMENSION_IDS, scores):
+        if isinstance(score, bool) or not isinstance(score, int) or not 0 <= score <= 100:
+            raise BadRequest(f"'{dim_id}' must be an integer from 0 to 100")
+    company_name = item.get(NAME_COLUMN)
+    if not isinstance(company_name, (str, type(None))):
+        raise BadRequest(f"'{NAME_COLUMN}' must be text")
+    return company_name or '', scores
+
+def item_analysis(item):
+    if isinstance(item, dict) and 'dimensions' in item:
+        validate_analysis(item)
+        return item
+    company_name, scores = item_scores(item)
+    for field in [f"{d}_notes" for d in DIMENSION_IDS] + ['timestamp']:
+        if not isinstance(item.get(field), (str, type(None))):
+            raise BadRequest(f"'{field}' must be text")
+    notes = [item.get(f"{d}_notes") or '' for d in DIMENSION_IDS]
+    return build_analysis(company_name, scores, notes, item.get('timestamp'))
+
+def batch_items(body):
+    items = body.get('analyses') if isinstance(body, dict) else body
+    if not isinstance(items, list):
+        raise BadRequest("expected a JSON array of analyses or {\"analyses\": [...]}")
+    return items
+
+def content_disposition(file_name):
+    # Company names can hold any text: an ASCII fallback for old clients
+    # plus the exact name percent-encoded (RFC 6266), never raw CR/LF
+    fallback = UNSAFE_FILENAME_RE.sub('_', file_name)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(file_name, safe='')}".encode('ascii')
+
+# --- Handlers ---
+# Each returns (status, content type, body bytes, extra headers)
+def score_one(body):
+    company_name, scores = item_scores(body)
+    overall = overall_score(scores)
+    return 200, "application/json", dumps({
+        NAME_COLUMN: company_name,
+        'overall_score': overall,
+        'classification': get_score_label(overall),
+        'high_scores': count_high_scores(scores),
+    }), ()
+
+def score_batch(body):
+    names, rows = [], []
+    for i, item in enumerate(batch_items(body)):
+        try:
+            name, scores = item_scores(item)
+        except ValueError as e:
+            raise BadRequest(f"analysis {i}: {e}") from None
+        names.append(name)
+        rows.append(scores)
+    if not rows:
+        return 200, "application/json", b'{"results":[]}', ()
+    overall, classes, high_scores = score_matrix(np.array(rows, dtype=np.int64))
+    results = [
+        dict(zip([NAME_COLUMN] + RESULT_COLUMNS, row))
+        for row in zip(names, overall.tolist(), CLASS_LABELS[classes].tolist(), high_scores.tolist())
+    ]
+    return 200, "application/json", dumps({'results': results}), ()
+
+def dimensions(_):
+    return 200, "application/json", dumps({
+        'dimensions': [{k: d[k] for k in ('id', 'title', 'subtitle', 'question', 'rubric')} for d in DIMENSIONS]
+    }), ()
+
+async def report_one(body, pool):
+    file_name, payload = await asyncio.get_running_loop().run_in_executor(pool, render_report, item_analysis(body))
+    return 200, DOCX_MIME, payload, ((b'content-disposition', content_disposition(file_name)),)
+
+async def report_batch(body, pool):
+    items = batch_items(body)
+    if len(items) > MAX_REPORT_BATCH:
+        raise BadRequest(f"at most {MAX_REPORT_BATCH} reports per request")
+    analyses = []
+    for i, item in enumerate(items):
+        try:
+            analyses.append(item_analysis(item))
+        except ValueError as e:
+            raise BadRequest(f"analysis {i}: {e}") from None
+    loop = asyncio.get_running_loop()
+    reports = await asyncio.gather(*(loop.run_in_executor(pool, render_report, a) for a in analyses))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
+        for i, (file_name, payload) in enumerate(reports, 1):
+            zf.writestr(f"{i:05d}_{file_name}", payload)
+    return 200, "application/zip", buffer.getvalue(), (
+        (b'content-disposition', b'attachment; filename="IMPACT_Reports.zip"'),
+    )
+
+SYNC_ROUTES = {
+    ('POST', '/score'): score_one,
+    ('POST', '/score/batch'): score_batch,
+    ('GET', '/dimensions'): dimensions,
+    ('GET', '/health'): lambda _: (200, "application/json", b'{"status":"ok"}', ()),
+}
+ASYNC_ROUTES = {
+    ('POST', '/report'): report_one,
+    ('POST', '/report/batch'): report_batch,
+}
+
+# --- ASGI App ---
+# Plain ASGI without a framework: scoring runs inline on the event loop
+# (microseconds per analysis), DOCX rendering goes to a process pool.
+def create_app(workers=None):
+    state = {}
+
+    def get_pool():
+        if 'pool' not in state:
+            state['pool'] = ProcessPoolExecutor(max_workers=workers)
+        return state['pool']
+
+    async def read_body(receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise BadRequest(f"request body over {MAX_BODY_BYTES} bytes")
+            chunks.append(chunk)
+            if not message.get('more_body'):
+                return b''.join(chunks)
+
+    async def app(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    if 'pool' in state:
+                        state['pool'].shutdown(cancel_futures=True)
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['type'] != 'http':
+            return
+
+        key = (scope['method'], scope['path'])
+        headers = ()
+        try:
+            if key in SYNC_ROUTES or key in ASYNC_ROUTES:
+                raw = await read_body(receive) if scope['method'] == 'POST' else b''
+                try:
+                    body = loads(raw) if raw else None
+                except ValueError as e:
+                    raise BadRequest(f"invalid JSON: {e}") from None
+                if key in SYNC_ROUTES:
+                    status, content_type, payload, headers = SYNC_ROUTES[key](body)
+                else:
+                    status, content_type, payload, headers = await ASYNC_ROUTES[key](body, get_pool())
+            elif any(path == scope['path'] for _, path in list(SYNC_ROUTES) + list(ASYNC_ROUTES)):
+                status, content_type, payload = 405, "application/json", dumps({'error': "method not allowed"})
+            else:
+                status, content_type, payload = 404, "application/json", dumps({'error': "not found"})
+        except ValueError as e:
+            # BadRequest and validate_analysis errors
+            status, content_type, payload = 400, "application/json", dumps({'error': str(e)})
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (b'content-type', content_type.encode()),
+                (b'content-length', str(len(payload)).encode()),
+                *headers,
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': payload})
+
+    return app
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Local HTTP API for IMPACT scoring and reports.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('-w', '--workers', type=int, default=None, help="report worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    uvicorn.run(create_app(args.workers), host=args.host, port=args.port,
+                log_level='warning', access_log=False, lifespan='on')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+import queue
+import sqlite3
+import threading
+import time
+
+from impact import store
+from impact.core import build_analysis
+
+DEFAULT_INTERVAL = 3.0
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+PRUNE_INTERVAL = 3600
+
+# --- Draft Writer ---
+# Reruns hand the current draft to a bounded queue and return at once; a
+# single background thread coalesces drafts per id and writes each at most
+# once per interval, batching every due draft into one transaction. A
+# failed write (e.g. the database is locked) keeps its drafts pending for
+# the next interval. Drafts untouched for max_age seconds are pruned hourly.
+class DraftWriter:
+    def __init__(self, path=store.DEFAULT_DB_PATH, interval=DEFAULT_INTERVAL, maxsize=DEFAULT_QUEUE_SIZE,
+                 max_age=DEFAULT_MAX_AGE):
+        self.path = path
+        self.interval = interval
+        self.max_age = max_age
+        self.dropped = 0
+        self.writes = 0
+        self.errors = 0
+        self.pruned = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="impact-autosave", daemon=True)
+        self._thread.start()
+
+    def submit(self, draft_id, company_name, scores, notes):
+        # Never blocks: when the queue is full the oldest entry is dropped,
+        # since every entry carries a complete draft.
+        item = (draft_id, (company_name, tuple(scores), tuple(notes)))
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def close(self, timeout=10):
+        # Writes everything still pending, ignoring the interval
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _prune(self, conn):
+        older_than = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(time.time() - self.max_age))
+        try:
+            self.pruned += store.prune_drafts(conn, older_than)
+        except sqlite3.Error:
+            self.errors += 1
+
+    def _run(self):
+        conn = store.connect(self.path)
+        pending = {}
+        last_write = {}
+        last_prune = None
+        while True:
+            stopping = self._stop.is_set()
+            try:
+                draft_id, draft = self._queue.get(timeout=0.05 if stopping else self.interval / 4)
+                pending[draft_id] = draft
+                # Take what is already queued, bounded so writes are never starved
+                for _ in range(self._queue.maxsize):
+                    draft_id, draft = self._queue.get_nowait()
+                    pending[draft_id] = draft
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            failed = False
+            due = [d for d in pending if stopping or now - last_write.get(d, 0) >= self.interval]
+            if due:
+                timestamp = time.strftime('%Y-%m-%dT%H:%M:%S')
+                batch = {d: pending.pop(d) for d in due}
+                try:
+                    store.save_drafts(conn, [(d, build_analysis(*draft, timestamp)) for d, draft in batch.items()])
+                    self.writes += 1
+                except sqlite3.Error:
+                    # Retry next interval, unless a newer draft arrived meanwhile
+                    self.errors += 1
+                    failed = True
+                    for d, draft in batch.items():
+                        pending.setdefault(d, draft)
+                for d in due:
+                    last_write[d] = now
+            # Forget ids whose interval has passed; they may write immediately
+            for d in [d for d, t in last_write.items() if now - t >= self.interval and d not in pending]:
+                del last_write[d]
+            if last_prune is None or now - last_prune >= PRUNE_INTERVAL:
+                self._prune(conn)
+                last_prune = now
+            if stopping and (failed or not pending):
+                conn.close()
+                return
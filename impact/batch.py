@@ -0,0 +1,166 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+import numpy as np
+
+from impact.core import DIMENSION_IDS, HIGH_THRESHOLD, LOW_THRESHOLD
+
+NAME_COLUMN = 'company_name'
+RESULT_COLUMNS = ['overall_score', 'classification', 'high_scores']
+CLASS_LABELS = np.array(["Low Impact", "Medium Impact", "High Impact"])
+DEFAULT_CHUNK_SIZE = 100_000
+
+# --- Vectorized Scoring ---
+def score_matrix(scores):
+    # scores: (n, 6) array in DIMENSIONS order
+    scores = np.asarray(scores, dtype=np.float64)
+    overall = np.round(scores.sum(axis=1) / len(DIMENSION_IDS)).astype(np.int64)
+    classes = (overall >= LOW_THRESHOLD).astype(np.int8) + (overall >= HIGH_THRESHOLD)
+    high_scores = (scores >= HIGH_THRESHOLD).sum(axis=1)
+    return overall, classes, high_scores
+
+# --- Chunked Readers ---
+# Chunks are parsed whole; only when one fails are its lines parsed one by
+# one to find the first bad row, so errors name the file and line number
+# without slowing down clean input.
+def chunk_error(path, first_line, raw, parse_line, error):
+    # raw holds the chunk's lines from first_line on; returns a ValueError
+    # naming the first line parse_line rejects
+    for i, line in enumerate(raw):
+        if line.strip():
+            try:
+                parse_line(line)
+            except (ValueError, TypeError) as e:
+                return ValueError(f"{path}, line {first_line + i}: {e}")
+    return ValueError(f"{path}, lines {first_line}-{first_line + len(raw) - 1}: {error}")
+
+def iter_csv_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    # One company per line; numeric columns go through NumPy's C parser.
+    with open(path, newline='', encoding='utf-8') as f:
+        header = next(csv.reader([f.readline()]))
+        missing = [d for d in DIMENSION_IDS if d not in header]
+        if missing:
+            raise ValueError(f"{path}: missing dimension columns {missing}")
+        score_cols = [header.index(d) for d in DIMENSION_IDS]
+        name_col = header.index(NAME_COLUMN) if NAME_COLUMN in header else None
+
+        def parse(lines):
+            matrix = np.loadtxt(lines, delimiter=',', quotechar='"', usecols=score_cols,
+                                dtype=np.float64, ndmin=2)
+            if name_col is None:
+                return [''] * len(lines), matrix
+            names = np.loadtxt(lines, delimiter=',', quotechar='"', usecols=(name_col,),
+                               dtype=str, ndmin=1).tolist()
+            return names, matrix
+
+        first_line = 2
+        while True:
+            raw = list(islice(f, chunk_size))
+            lines = [line for line in raw if line.strip()]
+            if not lines:
+                if not raw:
+                    break
+                first_line += len(raw)
+                continue
+            try:
+                names, matrix = parse(lines)
+            except ValueError as e:
+                raise chunk_error(path, first_line, raw, lambda line: parse([line]), e) from None
+            yield names, matrix
+            first_line += len(raw)
+
+def parse_jsonl_record(line):
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("expected a JSON object")
+    missing = [d for d in DIMENSION_IDS if d not in record]
+    if missing:
+        raise ValueError(f"missing dimensions {missing}")
+    np.array([record[d] for d in DIMENSION_IDS], dtype=np.float64)
+    return record
+
+def iter_jsonl_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    with open(path, encoding='utf-8') as f:
+        first_line = 1
+        while True:
+            raw = list(islice(f, chunk_size))
+            if not raw:
+                break
+            try:
+                records = [json.loads(line) for line in raw if line.strip()]
+                names = [r.get(NAME_COLUMN, '') for r in records]
+                matrix = np.array([[r[d] for d in DIMENSION_IDS] for r in records], dtype=np.float64)
+            except (ValueError, TypeError, KeyError, AttributeError) as e:
+                raise chunk_error(path, first_line, raw, parse_jsonl_record, e) from None
+            if records:
+                yield names, matrix.reshape(-1, len(DIMENSION_IDS))
+            first_line += len(raw)
+
+def iter_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    if str(path).endswith('.jsonl'):
+        return iter_jsonl_chunks(path, chunk_size)
+    return iter_csv_chunks(path, chunk_size)
+
+# --- Streaming Writers ---
+def write_csv_results(f, chunks):
+    writer = csv.writer(f)
+    writer.writerow([NAME_COLUMN] + RESULT_COLUMNS)
+    for names, overall, labels, high_scores in chunks:
+        writer.writerows(zip(names, overall, labels, high_scores))
+
+def write_jsonl_results(f, chunks):
+    for names, overall, labels, high_scores in chunks:
+        f.writelines(
+            json.dumps(dict(zip([NAME_COLUMN] + RESULT_COLUMNS, row))) + '\n'
+            for row in zip(names, overall, labels, high_scores)
+        )
+
+def score_file(input_path, output_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    stats = {'rows': 0}
+
+    def scored_chunks():
+        for names, matrix in iter_chunks(input_path, chunk_size):
+            overall, classes, high_scores = score_matrix(matrix)
+            stats['rows'] += len(names)
+            yield names, overall.tolist(), CLASS_LABELS[classes].tolist(), high_scores.tolist()
+
+    # Results go to a temporary file next to the output and replace it only
+    # once every row is scored, so a failed run leaves no partial file.
+    write = write_jsonl_results if str(output_path).endswith('.jsonl') else write_csv_results
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+            write(f, scored_chunks())
+        os.replace(temp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return stats['rows']
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/JSONL of companies with the IMPACT framework.")
+    parser.add_argument('input', help="CSV or JSONL file with one column per dimension id")
+    parser.add_argument('output', help="CSV or JSONL file to write results to")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        rows = score_file(args.input, args.output, args.chunk_size)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"Scored {rows} companies in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+import argparse
+import os
+import resource
+import sys
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from impact.core import overall_score, report_file_name, validate_analysis
+from impact.loader import iter_file, iter_valid
+
+# --- Input ---
+def iter_analyses(paths):
+    # Accepts export_json documents, JSON arrays of them, JSONL files or
+    # directories of .json files.
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from iter_analyses(sorted(path.glob('*.json')))
+        else:
+            yield from iter_file(path)
+
+def format_timestamp(timestamp):
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return timestamp or datetime.now().strftime("%Y-%m-%d %H:%M")
+
+# --- Rendering ---
+def render_report(data):
+    from impact.reports import generate_word_doc
+
+    company_name, scores, notes, timestamp = validate_analysis(data)
+    buffer = generate_word_doc(company_name, overall_score(scores), format_timestamp(timestamp), scores, notes)
+    try:
+        date = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        date = datetime.now()
+    return report_file_name(company_name, date), buffer.getvalue()
+
+def render_all(analyses, executor, max_pending):
+    # Keep a bounded window of in-flight reports so results are streamed
+    # out in order without buffering the whole batch.
+    pending = deque()
+    for data in analyses:
+        pending.append(executor.submit(render_report, data))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def write_zip(output_path, analyses, workers=None):
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        for file_name, payload in render_all(analyses, executor, workers * 4):
+            count += 1
+            zf.writestr(f"{count:05d}_{file_name}", payload)
+    return count
+
+def peak_rss_mb():
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    parent = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    worker = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return parent, worker
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render one IMPACT DOCX report per analysis into a ZIP.")
+    parser.add_argument('inputs', nargs='+', help="export_json files, JSON arrays, JSONL files or directories")
+    parser.add_argument('-o', '--output', default='IMPACT_Reports.zip')
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    errors = []
+    count = write_zip(args.output, iter_valid(iter_analyses(args.inputs), errors), args.workers)
+    elapsed = time.perf_counter() - start
+    parent_rss, worker_rss = peak_rss_mb()
+    print(f"Wrote {count} reports to {args.output} in {elapsed:.2f}s "
+          f"({count / max(elapsed, 1e-9):.1f} files/s)")
+    print(f"Peak RSS: parent {parent_rss:.1f} MB, largest worker {worker_rss:.1f} MB")
+    for index, message in errors[:20]:
+        print(f"  skipped document {index}: {message}", file=sys.stderr)
+    if len(errors) > 20:
+        print(f"  ... and {len(errors) - 20} more invalid documents", file=sys.stderr)
+    return 1 if errors and not count else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+from functools import lru_cache
+
+from impact.core import DIMENSIONS
+
+BENCHMARK_VALUES = [20, 80, 20, 30, 95, 20]
+PEER_COLORS = ['#198754', '#dc3545', '#6610f2', '#fd7e14', '#0dcaf0', '#d63384', '#20c997', '#ffc107']
+
+def radar_layout():
+    return dict(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickfont=dict(size=11, color='#495057'),
+                gridcolor='#dee2e6',
+                linecolor='#dee2e6'
+            ),
+            angularaxis=dict(
+                gridcolor='#dee2e6',
+                linecolor='#dee2e6',
+                tickfont=dict(size=11, color='#495057', weight=600)
+            ),
+            bgcolor='white'
+        ),
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.2,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=12, color='#495057')
+        ),
+        margin=dict(l=80, r=80, t=40, b=80),
+        height=500,
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        font=dict(family="system-ui, -apple-system, sans-serif", color='#495057')
+    )
+
+# --- Analysis Radar ---
+# The layout and the benchmark trace are validated by plotly once per
+# process; each chart only adds the current-analysis (and peer) traces as
+# plain dicts. Finished figures are shared across sessions, memoized per
+# (scores, show_benchmark) and must be treated as read-only.
+# plotly is imported inside the builders so the scoring core stays import-light.
+RADAR_CACHE_SIZE = 1024
+
+def radar_theta():
+    categories = [d['title'] for d in DIMENSIONS]
+    return categories + [categories[0]]
+
+@lru_cache(maxsize=2)
+def radar_base_spec(show_benchmark):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(layout=radar_layout())
+    if show_benchmark:
+        fig.add_trace(go.Scatterpolar(
+            r=BENCHMARK_VALUES + [BENCHMARK_VALUES[0]],
+            theta=radar_theta(),
+            fill='toself',
+            name='Traditional Bank',
+            line=dict(color='#6c757d', width=2, dash='dash'),
+            fillcolor='rgba(108, 117, 125, 0.1)',
+            marker=dict(size=6, color='#6c757d')
+        ))
+    return fig.to_dict()
+
+def current_analysis_trace(values):
+    return dict(
+        type='scatterpolar',
+        r=list(values) + [values[0]],
+        theta=radar_theta(),
+        fill='toself',
+        name='Current Analysis',
+        line=dict(color='#0d6efd', width=2),
+        fillcolor='rgba(13, 110, 253, 0.2)',
+        marker=dict(size=8, color='#0d6efd')
+    )
+
+def peer_trace(i, label, values):
+    color = PEER_COLORS[i % len(PEER_COLORS)]
+    return dict(
+        type='scatterpolar',
+        r=list(values) + [values[0]],
+        theta=radar_theta(),
+        name=label,
+        line=dict(color=color, width=1.5, dash='dot'),
+        marker=dict(size=4, color=color)
+    )
+
+def build_radar_chart(values, show_benchmark, peers=()):
+    import plotly.graph_objects as go
+
+    base = radar_base_spec(show_benchmark)
+    data = [current_analysis_trace(values)] + base['data']
+    # peers: [(label, values)] from the nearest-peer search
+    data += [peer_trace(i, label, peer_values) for i, (label, peer_values) in enumerate(peers)]
+    return go.Figure(data=data, layout=base['layout'], _validate=False)
+
+@lru_cache(maxsize=RADAR_CACHE_SIZE)
+def cached_radar_chart(values, show_benchmark):
+    return build_radar_chart(values, show_benchmark)
+
+def create_radar_chart(values, show_benchmark, peers=()):
+    # Peer overlays vary with the store, so only plain charts are memoized
+    if peers:
+        return build_radar_chart(values, show_benchmark, peers)
+    return cached_radar_chart(tuple(values), bool(show_benchmark))
+
+# --- Portfolio Radar ---
+# Hundreds of companies on one radar. The spec is plain dicts so it can be
+# cached per selection and sent without per-trace plotly validation. Each
+# trace carries only its name and r values: theta comes from theta0/dtheta
+# and styling from the layout template. Above FILL_TRACE_LIMIT traces
+# switch to WebGL lines without fill, markers or legend entries.
+FILL_TRACE_LIMIT = 20
+
+def create_portfolio_radar_spec(portfolio, show_benchmark=False):
+    # portfolio: [(label, values)]
+    slim = len(portfolio) > FILL_TRACE_LIMIT
+    trace_type = 'scatterpolargl' if slim else 'scatterpolar'
+    dtheta = 360 / len(DIMENSIONS)
+
+    layout = radar_layout()
+    layout['polar']['angularaxis'].update(
+        tickmode='array',
+        tickvals=[i * dtheta for i in range(len(DIMENSIONS))],
+        ticktext=[d['title'] for d in DIMENSIONS],
+        showgrid=True
+    )
+    layout['colorway'] = PEER_COLORS
+    layout['showlegend'] = not slim
+    if slim:
+        style = dict(mode='lines', line=dict(width=1), opacity=0.35, hoverinfo='name')
+    else:
+        style = dict(mode='lines+markers', fill='toself', opacity=0.6, marker=dict(size=4))
+    layout['template'] = dict(data={trace_type: [dict(theta0=0, dtheta=dtheta, **style)]})
+
+    data = [
+        dict(type=trace_type, r=list(values) + [values[0]], name=label)
+        for label, values in portfolio
+    ]
+    if show_benchmark:
+        data.append(dict(
+            type='scatterpolar', r=BENCHMARK_VALUES + [BENCHMARK_VALUES[0]], theta0=0, dtheta=dtheta,
+            name='Traditional Bank', mode='lines', opacity=1,
+            line=dict(color='#6c757d', width=2, dash='dash')
+        ))
+    return dict(data=data, layout=layout)
+
+def overlay_current_analysis(spec, values):
+    # Returns a new figure sharing the cached portfolio traces and layout
+    import plotly.graph_objects as go
+
+    dtheta = 360 / len(DIMENSIONS)
+    current = dict(
+        type='scatterpolar', r=list(values) + [values[0]], theta0=0, dtheta=dtheta,
+        name='Current Analysis', mode='lines+markers', fill='toself', opacity=1,
+        line=dict(color='#0d6efd', width=3), fillcolor='rgba(13, 110, 253, 0.2)',
+        marker=dict(size=8, color='#0d6efd')
+    )
+    # The cached spec was built from valid plotly attributes; skipping
+    # validation keeps this O(1) in plotly work per trace.
+    return go.Figure(data=spec['data'] + [current], layout=spec['layout'], _validate=False)
+
+# --- History Animation ---
+# One frame per dated analysis (or quarter) of a company; the benchmark, if
+# shown, stays fixed while frames replace only the company trace.
+def create_radar_animation(history, show_benchmark=False):
+    # history: [(label, values)] oldest first
+    categories = [d['title'] for d in DIMENSIONS]
+    theta = categories + [categories[0]]
+
+    def company_trace(label, values):
+        return dict(
+            type='scatterpolar', r=list(values) + [values[0]], theta=theta, fill='toself', name=label,
+            line=dict(color='#0d6efd', width=2), fillcolor='rgba(13, 110, 253, 0.2)',
+            marker=dict(size=8, color='#0d6efd')
+        )
+
+    data = [company_trace(*history[-1])]
+    if show_benchmark:
+        data.append(dict(
+            type='scatterpolar', r=BENCHMARK_VALUES + [BENCHMARK_VALUES[0]], theta=theta,
+            name='Traditional Bank', line=dict(color='#6c757d', width=2, dash='dash'),
+            marker=dict(size=6, color='#6c757d')
+        ))
+    frames = [dict(name=label, data=[company_trace(label, values)], traces=[0]) for label, values in history]
+
+    frame_args = dict(frame=dict(duration=600, redraw=True), transition=dict(duration=300), mode='immediate')
+    layout = radar_layout()
+    layout['updatemenus'] = [dict(
+        type='buttons', direction='left', x=0, y=0, xanchor='left', yanchor='top', pad=dict(t=50),
+        buttons=[
+            dict(label='▶ Play', method='animate', args=[None, dict(frame_args, fromcurrent=True)]),
+            dict(label='❚❚ Pause', method='animate', args=[[None], dict(frame_args, frame=dict(duration=0, redraw=False))]),
+        ]
+    )]
+    layout['sliders'] = [dict(
+        active=len(history) - 1, x=0.15, len=0.85, y=0, pad=dict(t=40),
+        currentvalue=dict(prefix='Date: '),
+        steps=[dict(label=label, method='animate', args=[[label], frame_args]) for label, _ in history]
+    )]
+    return dict(data=data, layout=layout, frames=frames)
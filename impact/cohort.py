@@ -0,0 +1,69 @@
+import numpy as np
+
+from impact.store import HISTOGRAM_DIMENSIONS
+
+BAND_QUANTILES = (0.25, 0.75)
+
+# --- Cohort Statistics ---
+# Distribution of every dimension (and the overall score) across the
+# portfolio, as exact 0-100 count histograms. Adding analyses or merging
+# another shard's stats is a vector add; moments and percentiles are read
+# off the 101 bins.
+class CohortStats:
+    def __init__(self, counts=None):
+        shape = (len(HISTOGRAM_DIMENSIONS), 101)
+        self.counts = np.zeros(shape, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64).reshape(shape)
+
+    @classmethod
+    def from_histograms(cls, histograms):
+        return cls([histograms[d] for d in HISTOGRAM_DIMENSIONS])
+
+    def add(self, scores, overall):
+        # scores in DIMENSIONS order plus the overall score of one analysis
+        self.counts[np.arange(len(HISTOGRAM_DIMENSIONS)), list(scores) + [overall]] += 1
+
+    def merge(self, other):
+        return CohortStats(self.counts + other.counts)
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    # --- Statistics ---
+    @property
+    def size(self):
+        return int(self.counts[0].sum())
+
+    def mean(self):
+        total = np.maximum(self.counts.sum(axis=1), 1)
+        return self.counts @ np.arange(101) / total
+
+    def std(self):
+        total = np.maximum(self.counts.sum(axis=1), 1)
+        values = np.arange(101)
+        mean = self.counts @ values / total
+        return np.sqrt(np.maximum(self.counts @ values ** 2 / total - mean ** 2, 0))
+
+    def quantile(self, q):
+        # Smallest score whose cumulative share reaches q, per dimension
+        cumulative = self.counts.cumsum(axis=1)
+        targets = np.maximum(np.ceil(q * cumulative[:, -1]), 1)
+        return (cumulative < targets[:, None]).sum(axis=1)
+
+    def percentile_rank(self, scores, overall):
+        # Midrank percentile of each value within its dimension, 0-100
+        values = np.asarray(list(scores) + [overall])
+        rows = np.arange(len(HISTOGRAM_DIMENSIONS))
+        below = np.where(np.arange(101) < values[:, None], self.counts, 0).sum(axis=1)
+        equal = self.counts[rows, values]
+        total = np.maximum(self.counts.sum(axis=1), 1)
+        return (below + 0.5 * equal) / total * 100
+
+    def bands(self):
+        # Per-dimension (low, high) score band holding the middle of the cohort
+        low, high = (self.quantile(q) for q in BAND_QUANTILES)
+        return list(zip(low.tolist(), high.tolist()))
+
+def ordinal(n):
+    n = int(round(n))
+    suffix = 'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
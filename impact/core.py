@@ -0,0 +1,196 @@
+import hashlib
+import json
+from datetime import datetime
+
+# --- Data Definitions ---
+DIMENSIONS = [
+    {
+        'id': 'integration',
+        'letter': 'I',
+        'icon': '🔗',
+        'title': 'Integration',
+        'subtitle': 'Connectivity',
+        'color': '#0d6efd',
+        'lightColor': '#e7f1ff',
+        'question': 'Is it an Island or an Ecosystem?',
+        'leftLabel': 'Closed / Island',
+        'rightLabel': 'Open API Platform',
+        'rubric': {
+            'low': 'Closed system. No APIs. Hard to export data. "Walled Garden."',
+            'medium': 'Some integrations (e.g., connects to Xero), but largely self-contained.',
+            'high': 'API-first architecture. Allows developers to build on top. Two-way data flow.'
+        }
+    },
+    {
+        'id': 'monetization',
+        'letter': 'M',
+        'icon': '💰',
+        'title': 'Monetization',
+        'subtitle': 'Unit Economics',
+        'color': '#198754',
+        'lightColor': '#d1f4e8',
+        'question': 'Growth at all costs or sustainable?',
+        'leftLabel': 'Burning Cash',
+        'rightLabel': 'Sustainable Profit',
+        'rubric': {
+            'low': 'Freemium with no clear upsell. High burn. Subsidized by VC money.',
+            'medium': 'Generating revenue (interchange fees), but barely covering costs.',
+            'high': 'Strong LTV > CAC. Diversified revenue (Sub + Trans + Data).'
+        }
+    },
+    {
+        'id': 'painPoint',
+        'letter': 'P',
+        'icon': '🩹',
+        'title': 'Pain Point',
+        'subtitle': 'Differentiation',
+        'color': '#dc3545',
+        'lightColor': '#ffe5e8',
+        'question': 'Vitamin or Painkiller?',
+        'leftLabel': 'Nice-to-have (UI)',
+        'rightLabel': '10x Solution',
+        'rubric': {
+            'low': 'Cosmetic changes. Just a prettier app for a standard bank account.',
+            'medium': 'Reduces friction (faster onboarding), but core product is standard.',
+            'high': 'Solves deep friction (e.g., instant cross-border). Users cannot go back.'
+        }
+    },
+    {
+        'id': 'automation',
+        'letter': 'A',
+        'icon': '🤖',
+        'title': 'Automation',
+        'subtitle': 'Tech Depth',
+        'color': '#6610f2',
+        'lightColor': '#f0e7ff',
+        'question': 'Wrapper or Deep Tech?',
+        'leftLabel': 'Human/Manual',
+        'rightLabel': 'AI/Algorithmic',
+        'rubric': {
+            'low': 'Manual processes behind scenes. Rule-based logic only.',
+            'medium': 'Some automation in KYC, but support is human-heavy.',
+            'high': 'Proprietary AI/ML models. Algorithmic underwriting. Self-driving finance.'
+        }
+    },
+    {
+        'id': 'compliance',
+        'letter': 'C',
+        'icon': '⚖️',
+        'title': 'Compliance',
+        'subtitle': 'Trust',
+        'color': '#fd7e14',
+        'lightColor': '#fff3e6',
+        'question': 'Regulatory Arbitrage or Trust?',
+        'leftLabel': 'Grey Area',
+        'rightLabel': 'Fully Licensed',
+        'rubric': {
+            'low': 'Unregulated. Operating across borders to avoid rules.',
+            'medium': 'Partnering with a sponsor bank (BaaS) to rent a license.',
+            'high': 'Full Banking Charter. Direct regulator relationship. Heavy compliance.'
+        }
+    },
+    {
+        'id': 'target',
+        'letter': 'T',
+        'icon': '🎯',
+        'title': 'Target',
+        'subtitle': 'Inclusion',
+        'color': '#0dcaf0',
+        'lightColor': '#e7f8fc',
+        'question': 'Mass Market or Niche?',
+        'leftLabel': 'Mass Market',
+        'rightLabel': 'Underserved Niche',
+        'rubric': {
+            'low': 'Competing for prime customers (High FICO) like major banks.',
+            'medium': 'Millennials/Gen-Z focus, but still generally bankable.',
+            'high': 'Unbanked, gig-workers, immigrants, or specific vertical niches.'
+        }
+    }
+]
+
+DIMENSION_IDS = [d['id'] for d in DIMENSIONS]
+
+LOW_THRESHOLD = 30
+HIGH_THRESHOLD = 70
+
+# --- Scoring ---
+def get_score_color(score):
+    if score < LOW_THRESHOLD: return "#c53030"
+    if score < HIGH_THRESHOLD: return "#c05621"
+    return "#15803d"
+
+def get_score_class(score):
+    if score < LOW_THRESHOLD: return "score-low"
+    if score < HIGH_THRESHOLD: return "score-medium"
+    return "score-high"
+
+def get_score_label(score):
+    if score < LOW_THRESHOLD: return "Low Impact"
+    if score < HIGH_THRESHOLD: return "Medium Impact"
+    return "High Impact"
+
+def overall_score(scores):
+    return round(sum(scores) / len(DIMENSIONS))
+
+def count_high_scores(scores):
+    return sum(1 for s in scores if s >= HIGH_THRESHOLD)
+
+# --- Analysis Documents ---
+def build_analysis(company_name, scores, notes, timestamp=None):
+    data = {
+        'company_name': company_name,
+        'timestamp': timestamp or datetime.now().isoformat(),
+        'overall_score': overall_score(scores),
+        'dimensions': {}
+    }
+    
+    for dim, score, note in zip(DIMENSIONS, scores, notes):
+        data['dimensions'][dim['id']] = {
+            'title': dim['title'],
+            'score': score,
+            'notes': note
+        }
+    
+    return data
+
+def export_json(company_name, scores, notes, timestamp=None):
+    return json.dumps(build_analysis(company_name, scores, notes, timestamp), indent=2)
+
+def get_analysis_key(company_name, scores, notes):
+    payload = json.dumps([company_name, list(scores), list(notes)])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def parse_analysis(data):
+    # Inverse of build_analysis: (company_name, scores, notes, timestamp)
+    dims = data['dimensions']
+    scores = [dims[d]['score'] for d in DIMENSION_IDS]
+    notes = [dims[d].get('notes', '') for d in DIMENSION_IDS]
+    return data.get('company_name', ''), scores, notes, data.get('timestamp')
+
+def validate_analysis(data):
+    # Checks an imported document against the export_json schema and
+    # returns parse_analysis(data); raises ValueError naming the bad field.
+    if not isinstance(data, dict):
+        raise ValueError("analysis must be a JSON object")
+    dims = data.get('dimensions')
+    if not isinstance(dims, dict):
+        raise ValueError("'dimensions' must be an object")
+    for dim_id in DIMENSION_IDS:
+        dim = dims.get(dim_id)
+        if not isinstance(dim, dict):
+            raise ValueError(f"missing dimension '{dim_id}'")
+        score = dim.get('score')
+        if isinstance(score, bool) or not isinstance(score, int) or not 0 <= score <= 100:
+            raise ValueError(f"'{dim_id}' score must be an integer from 0 to 100")
+        if not isinstance(dim.get('notes', ''), (str, type(None))):
+            raise ValueError(f"'{dim_id}' notes must be text")
+    for field in ('company_name', 'timestamp'):
+        if not isinstance(data.get(field), (str, type(None))):
+            raise ValueError(f"'{field}' must be text")
+    company_name, scores, notes, timestamp = parse_analysis(data)
+    return company_name or '', scores, [note or '' for note in notes], timestamp
+
+def report_file_name(company_name, date, ext='docx'):
+    prefix = 'IMPACT_Analysis' if ext == 'docx' else 'IMPACT_Data'
+    safe_name = (company_name or 'Company').replace('/', '_').replace('\\', '_')
+    return f"{prefix}_{safe_name}_{date.strftime('%Y%m%d')}.{ext}"
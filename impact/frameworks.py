@@ -0,0 +1,137 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from impact.batch import CLASS_LABELS
+from impact.core import DIMENSION_IDS, DIMENSIONS, HIGH_THRESHOLD, LOW_THRESHOLD
+
+# The schemes shipped next to the package, independent of the working directory
+BUNDLED_FRAMEWORKS_PATH = str(Path(__file__).resolve().parent.parent / 'frameworks.json')
+DEFAULT_FRAMEWORKS_PATH = os.environ.get('IMPACT_FRAMEWORKS_PATH', BUNDLED_FRAMEWORKS_PATH)
+
+# The built-in scheme: equal weights and the core thresholds, i.e. exactly
+# overall_score / get_score_label. It is always first and is the baseline
+# that other schemes' rank changes are measured against.
+EQUAL_WEIGHTS = {
+    'name': "IMPACT (equal weights)",
+    'description': "Every dimension counts the same.",
+    'weights': {d: 1 for d in DIMENSION_IDS},
+    'thresholds': {'low': LOW_THRESHOLD, 'high': HIGH_THRESHOLD},
+}
+
+# --- Definitions ---
+# A frameworks file is a JSON list (or {"frameworks": [...]}) of
+#   {"name": ..., "description": ..., "weights": {<dimension id>: weight},
+#    "thresholds": {"low": 30, "high": 70}}
+# Weights are relative and non-negative; a dimension left out weighs 1 and
+# a weight of 0 drops it. Thresholds default to the core ones. Schemes
+# reweight the six IMPACT dimensions, since that is what saved analyses hold.
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def validate_framework(data):
+    if not isinstance(data, dict):
+        raise ValueError("each framework must be a JSON object")
+    name = data.get('name')
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("framework 'name' must be a non-empty string")
+    description = data.get('description', '')
+    if not isinstance(description, str):
+        raise ValueError(f"{name}: 'description' must be a string")
+
+    weights = data.get('weights', {})
+    if not isinstance(weights, dict):
+        raise ValueError(f"{name}: 'weights' must be an object of dimension id to weight")
+    unknown = sorted(set(weights) - set(DIMENSION_IDS))
+    if unknown:
+        raise ValueError(f"{name}: unknown dimensions {unknown}")
+    weights = {d: weights.get(d, 1) for d in DIMENSION_IDS}
+    for dim_id, weight in weights.items():
+        if not is_number(weight) or not weight >= 0:
+            raise ValueError(f"{name}: weight for '{dim_id}' must be a number >= 0")
+    if not sum(weights.values()) > 0:
+        raise ValueError(f"{name}: at least one weight must be above 0")
+
+    thresholds = data.get('thresholds', {})
+    if not isinstance(thresholds, dict):
+        raise ValueError(f"{name}: 'thresholds' must be an object with 'low' and 'high'")
+    thresholds = {'low': LOW_THRESHOLD, 'high': HIGH_THRESHOLD, **thresholds}
+    low, high = thresholds['low'], thresholds['high']
+    if not (is_number(low) and is_number(high) and 0 <= low <= high <= 100):
+        raise ValueError(f"{name}: 'thresholds' must satisfy 0 <= low <= high <= 100")
+
+    return {'name': name.strip(), 'description': description, 'weights': weights,
+            'thresholds': {'low': low, 'high': high}}
+
+def load_frameworks(path=DEFAULT_FRAMEWORKS_PATH):
+    # Returns [EQUAL_WEIGHTS, *validated file schemes]. Only a missing
+    # bundled file gives the built-in scheme alone; a configured path that
+    # does not exist is an error.
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        if str(path) != BUNDLED_FRAMEWORKS_PATH:
+            raise
+        data = []
+    items = data.get('frameworks') if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        raise ValueError(f"{path}: expected a JSON list of frameworks or {{\"frameworks\": [...]}}")
+
+    frameworks = [EQUAL_WEIGHTS]
+    for i, item in enumerate(items):
+        try:
+            frameworks.append(validate_framework(item))
+        except ValueError as e:
+            raise ValueError(f"{path}: framework {i}: {e}") from None
+    names = [f['name'] for f in frameworks]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"{path}: duplicate framework names {duplicates}")
+    return frameworks
+
+# --- Compiled Schemes ---
+# K schemes become a (6, K) weight matrix plus per-scheme totals and
+# thresholds, so scoring N analyses under every scheme is one (N, 6) @
+# (6, K) product. Raw weights are kept and the product divided by their
+# total, which for equal weights reproduces overall_score exactly (integer
+# sums, then round half to even like Python's round).
+class CompiledFrameworks:
+    def __init__(self, frameworks):
+        self.frameworks = list(frameworks)
+        self.names = [f['name'] for f in self.frameworks]
+        self.weights = np.array([[f['weights'][d] for f in self.frameworks] for d in DIMENSION_IDS], dtype=np.float64)
+        self.totals = self.weights.sum(axis=0)
+        self.low = np.array([f['thresholds']['low'] for f in self.frameworks], dtype=np.float64)
+        self.high = np.array([f['thresholds']['high'] for f in self.frameworks], dtype=np.float64)
+
+    def __len__(self):
+        return len(self.names)
+
+    def score(self, scores):
+        # scores: (n, 6) in DIMENSIONS order -> (n, K) int64 overall scores
+        scores = np.asarray(scores, dtype=np.float64).reshape(-1, len(DIMENSION_IDS))
+        return np.rint(scores @ self.weights / self.totals).astype(np.int64)
+
+    def classify(self, overall):
+        # (n, K) overall scores -> (n, K) indices into CLASS_LABELS
+        return (overall >= self.low).astype(np.int8) + (overall >= self.high)
+
+    def labels(self, overall):
+        return CLASS_LABELS[self.classify(overall)]
+
+    def weight_shares(self, k):
+        # [(dimension title, share of total weight)] of scheme k
+        return [(d['title'], float(w / self.totals[k])) for d, w in zip(DIMENSIONS, self.weights[:, k])]
+
+# --- Rankings ---
+def rank_order(overall):
+    # Indices best first; ties keep storage order
+    return np.argsort(-overall, kind='stable')
+
+def ranks_from_order(order):
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(1, len(order) + 1)
+    return ranks
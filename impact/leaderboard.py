@@ -0,0 +1,137 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from impact.batch import CLASS_LABELS, score_matrix
+from impact.core import DIMENSION_IDS
+
+SORT_KEYS = ['overall_score', *DIMENSION_IDS, 'timestamp', 'company_name']
+FILTER_CACHE_SIZE = 64
+
+def merge_order(order, values, start):
+    # order is the stable ascending order of values[:start]; returns it with
+    # rows start.. merged in. New rows sort after equal old ones, exactly as
+    # a stable argsort of all values would place them.
+    new = start + np.argsort(values[start:], kind='stable')
+    at = np.searchsorted(values[order], values[new], side='right')
+    return np.insert(order, at, new)
+
+# --- Leaderboard ---
+# Every stored analysis as column arrays (shared with the peer index) plus
+# one presorted row order per sort key, so a page is a slice of a cached
+# order. Rows saved later are merged into each order in O(N) instead of
+# re-sorting. Company names are factorized: name sort and search work on
+# integer codes and the distinct names. Filtered orders are cached per
+# (sort, direction, classification, search) until the next update.
+class Leaderboard:
+    def __init__(self):
+        self.size = 0
+        self.ids = np.empty(0, dtype=np.int64)
+        self.names = np.empty(0, dtype=object)
+        self.timestamps = np.empty(0, dtype=object)
+        self.scores = np.empty((0, len(DIMENSION_IDS)), dtype=np.int16)
+        self.overall = np.empty(0, dtype=np.int16)
+        self.classes = np.empty(0, dtype=np.int8)
+        self.name_codes = np.empty(0, dtype=np.int32)
+        self._name_codes = {}
+        self._distinct_names = []
+        self._distinct_lower = []
+        self._orders = {key: np.empty(0, dtype=np.intp) for key in SORT_KEYS}
+        self._filtered = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.size
+
+    def sort_values(self, key):
+        if key == 'overall_score':
+            return self.overall
+        if key == 'timestamp':
+            return self.timestamps
+        if key == 'company_name':
+            distinct = self._distinct_names
+            rank = np.empty(len(distinct), dtype=np.int32)
+            rank[sorted(range(len(distinct)), key=lambda c: (distinct[c].casefold(), distinct[c]))] = np.arange(len(distinct))
+            return rank[self.name_codes]
+        return self.scores[:, DIMENSION_IDS.index(key)]
+
+    def update(self, ids, names, timestamps, vectors):
+        # Takes the peer index's arrays (rows in id order) and adds the rows
+        # past self.size. Returns the number of rows added.
+        n = len(vectors)
+        with self._lock:
+            start = self.size
+            if n <= start:
+                return 0
+            tail = np.asarray(vectors[start:n]).astype(np.int16)
+            overall, classes, _ = score_matrix(tail)
+            codes = [self._name_codes.setdefault(name, len(self._name_codes)) for name in names[start:n]]
+            new_names = list(self._name_codes)[len(self._distinct_names):]
+            self._distinct_names += new_names
+            self._distinct_lower += [name.casefold() for name in new_names]
+
+            self.ids = np.asarray(ids[:n])
+            self.names = np.asarray(names[:n])
+            self.timestamps = np.asarray(timestamps[:n])
+            self.scores = np.concatenate([self.scores, tail])
+            self.overall = np.concatenate([self.overall, overall.astype(np.int16)])
+            self.classes = np.concatenate([self.classes, classes])
+            self.name_codes = np.concatenate([self.name_codes, np.asarray(codes, dtype=np.int32)])
+            self.size = n
+
+            orders = {}
+            for key in SORT_KEYS:
+                values = self.sort_values(key)
+                if not (key == 'company_name' and new_names):
+                    orders[key] = merge_order(self._orders[key], values, start)
+                else:
+                    # New distinct names shift every name rank, so that order is rebuilt
+                    orders[key] = np.argsort(values, kind='stable')
+            self._orders = orders
+            self._filtered.clear()
+            return n - start
+
+    def _row_order(self, key, descending, classification, search):
+        order = self._orders[key]
+        if descending:
+            order = order[::-1]
+        if classification is None and not search:
+            return order
+        cache_key = (key, descending, classification, search)
+        if cache_key in self._filtered:
+            self._filtered.move_to_end(cache_key)
+            return self._filtered[cache_key]
+
+        mask = np.ones(self.size, dtype=bool)
+        if classification is not None:
+            mask &= self.classes == list(CLASS_LABELS).index(classification)
+        if search:
+            needle = search.casefold()
+            matched = np.fromiter((needle in name for name in self._distinct_lower), dtype=bool, count=len(self._distinct_lower))
+            mask &= matched[self.name_codes]
+        filtered = order[mask[order]]
+        self._filtered[cache_key] = filtered
+        if len(self._filtered) > FILTER_CACHE_SIZE:
+            self._filtered.popitem(last=False)
+        return filtered
+
+    def page(self, key='overall_score', descending=True, classification=None, search='', page=0, page_size=50):
+        # Returns (matching rows, {column: values}) for rows
+        # [page * page_size, (page + 1) * page_size) of the sorted, filtered view.
+        if key not in SORT_KEYS:
+            raise ValueError(f"unknown sort key {key!r}")
+        with self._lock:
+            order = self._row_order(key, descending, classification, search.strip())
+            rows = order[page * page_size:(page + 1) * page_size]
+            columns = {
+                'rank': list(range(page * page_size + 1, page * page_size + len(rows) + 1)),
+                'id': self.ids[rows].tolist(),
+                'company_name': self.names[rows].tolist(),
+                'overall_score': self.overall[rows].tolist(),
+                'classification': CLASS_LABELS[self.classes[rows]].tolist(),
+            }
+            for i, dim_id in enumerate(DIMENSION_IDS):
+                columns[dim_id] = self.scores[rows, i].tolist()
+            columns['timestamp'] = self.timestamps[rows].tolist()
+            return len(order), columns
@@ -0,0 +1,151 @@
+import argparse
+import json
+import re
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    orjson = None
+    loads = json.loads
+
+from impact import store
+from impact.core import validate_analysis
+
+READ_SIZE = 1 << 20
+DEFAULT_BATCH_SIZE = 5000
+
+# --- Streaming Parsers ---
+# JSON arrays and (concatenated) export_json documents are decoded one
+# document at a time with raw_decode from a rolling text buffer; a
+# document cut by the buffer end fails to decode and is retried once more
+# input is read. A number that runs into the buffer end decodes fine but
+# may continue in the next chunk, so it is retried too unless at EOF.
+# Memory stays at one read buffer plus one document.
+SEPARATOR_RE = re.compile(r'[\s,]*')
+NUMBER_TAIL_RE = re.compile(r'[\d.eE+-]*')
+MAX_DOCUMENT_CHARS = 64 << 20
+
+def iter_documents(f, read_size=READ_SIZE):
+    decoder = json.JSONDecoder()
+    buffer, pos = '', 0
+    in_array = None
+    eof = False
+    while True:
+        pos = SEPARATOR_RE.match(buffer, pos).end()
+        error = None
+        if pos < len(buffer):
+            if in_array is None:
+                in_array = buffer[pos] == '['
+                pos += in_array
+                continue
+            if in_array and buffer[pos] == ']':
+                return
+            try:
+                data, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                error = e
+            else:
+                cut = (not eof and isinstance(data, (int, float)) and not isinstance(data, bool)
+                       and NUMBER_TAIL_RE.match(buffer, end).end() == len(buffer))
+                if not cut:
+                    pos = end
+                    yield data
+                    continue
+
+        if eof:
+            if error:
+                raise ValueError(f"invalid JSON: {error}")
+            if in_array:
+                raise ValueError("invalid JSON: array is not closed")
+            return
+        chunk = f.read(read_size)
+        if not chunk:
+            eof = True
+            continue
+        if len(buffer) - pos > MAX_DOCUMENT_CHARS:
+            raise ValueError(f"invalid JSON or a document over {MAX_DOCUMENT_CHARS} chars: {error}")
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+# One document per line; orjson (when installed) decodes lines fastest. A
+# line that does not decode is yielded as an InvalidDocument, so one bad
+# line is reported like any other invalid document instead of ending the
+# stream.
+class InvalidDocument(ValueError):
+    pass
+
+def iter_jsonl(f):
+    for line in f:
+        if line.strip():
+            try:
+                yield loads(line)
+            except ValueError as e:
+                yield InvalidDocument(f"invalid JSON: {e}")
+
+def iter_file(path):
+    if str(path).endswith('.jsonl'):
+        with open(path, 'rb') as f:
+            yield from iter_jsonl(f)
+    else:
+        with open(path, encoding='utf-8') as f:
+            try:
+                yield from iter_documents(f)
+            except ValueError as e:
+                # A file that stops parsing is reported once; earlier documents stand
+                yield InvalidDocument(f"{path}: {e}")
+
+# --- Bulk Loading ---
+def iter_valid(documents, errors):
+    # Yields validated documents; invalid ones are recorded as (index, message)
+    for i, data in enumerate(documents):
+        try:
+            if isinstance(data, InvalidDocument):
+                raise data
+            validate_analysis(data)
+        except ValueError as e:
+            errors.append((i, str(e)))
+            continue
+        yield data
+
+def bulk_load(conn, path, batch_size=DEFAULT_BATCH_SIZE):
+    # Returns (rows loaded, [(document index, error)])
+    errors = []
+    loaded = 0
+    valid = iter_valid(iter_file(path), errors)
+    while True:
+        batch = list(islice(valid, batch_size))
+        if not batch:
+            break
+        loaded += store.save_analyses(conn, batch)
+    return loaded, errors
+
+def main(argv=None):
+    from impact.bulk_reports import peak_rss_mb
+
+    parser = argparse.ArgumentParser(description="Stream IMPACT analyses (JSON, JSON array or JSONL) into the portfolio store.")
+    parser.add_argument('input')
+    parser.add_argument('--db', default=store.DEFAULT_DB_PATH)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    conn = store.connect(args.db)
+    loaded, errors = bulk_load(conn, args.input, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    size_mb = Path(args.input).stat().st_size / 1e6
+    print(f"Loaded {loaded} analyses ({size_mb:.1f} MB) into {args.db} in {elapsed:.1f}s "
+          f"({size_mb / elapsed:.1f} MB/s, {'orjson' if orjson and args.input.endswith('.jsonl') else 'json'}), peak RSS {peak_rss_mb()[0]:.0f} MB")
+    for index, message in errors[:20]:
+        print(f"  skipped document {index}: {message}", file=sys.stderr)
+    if len(errors) > 20:
+        print(f"  ... and {len(errors) - 20} more invalid documents", file=sys.stderr)
+    return 1 if errors and not loaded else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from impact.store import SCORE_COLUMNS
+
+# One consistent view of the index. add() builds a new one and publishes it
+# in a single assignment, so readers that take index.arrays once never see
+# vectors and norms (or names) of different lengths.
+PeerArrays = namedtuple('PeerArrays', 'ids names timestamps vectors norms')
+
+# --- Peer Index ---
+# Score vectors of every stored analysis, kept as one contiguous float32
+# matrix with precomputed squared norms, so a k-nearest query is a single
+# matrix-vector product plus argpartition.
+class PeerIndex:
+    def __init__(self):
+        self.arrays = PeerArrays(
+            ids=np.empty(0, dtype=np.int64),
+            names=np.empty(0, dtype=object),
+            timestamps=np.empty(0, dtype=object),
+            vectors=np.empty((0, len(SCORE_COLUMNS)), dtype=np.float32),
+            norms=np.empty(0, dtype=np.float32),
+        )
+        self.last_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.arrays.ids)
+
+    def add(self, ids, names, timestamps, vectors):
+        ids = np.asarray(ids, dtype=np.int64)
+        names = np.asarray(names, dtype=object)
+        timestamps = np.asarray(timestamps, dtype=object)
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, len(SCORE_COLUMNS))
+        with self._lock:
+            # Concurrent refreshes can fetch the same rows; keep only ids
+            # past last_id so every analysis is indexed once
+            keep = ids > self.last_id
+            if not keep.all():
+                ids, names, timestamps, vectors = ids[keep], names[keep], timestamps[keep], vectors[keep]
+            if not len(ids):
+                return
+            old = self.arrays
+            self.arrays = PeerArrays(
+                ids=np.concatenate([old.ids, ids]),
+                names=np.concatenate([old.names, names]),
+                timestamps=np.concatenate([old.timestamps, timestamps]),
+                vectors=np.concatenate([old.vectors, vectors]),
+                norms=np.concatenate([old.norms, np.einsum('ij,ij->i', vectors, vectors)]),
+            )
+            self.last_id = int(ids.max())
+
+    def refresh(self, conn):
+        # Pull in analyses saved since the last refresh (by any session)
+        rows = conn.execute(
+            f"SELECT id, company_name, timestamp, {', '.join(SCORE_COLUMNS)} "
+            f"FROM analyses WHERE id > ? ORDER BY id",
+            (self.last_id,)
+        ).fetchall()
+        if rows:
+            rows = [tuple(r) for r in rows]
+            self.add([r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows],
+                     [r[3:] for r in rows])
+        return len(rows)
+
+    def query(self, values, k=5, exclude_name=None):
+        # Returns [(id, company_name, timestamp, distance, scores)] nearest first
+        arrays = self.arrays
+        if not len(arrays.norms) or k <= 0:
+            return []
+        q = np.asarray(values, dtype=np.float32)
+        dist = arrays.norms - 2.0 * (arrays.vectors @ q) + q @ q
+        if exclude_name:
+            dist = np.where(arrays.names == exclude_name, np.inf, dist)
+        k = min(k, len(dist))
+        nearest = np.argpartition(dist, k - 1)[:k]
+        nearest = nearest[np.argsort(dist[nearest])]
+        return [
+            (int(arrays.ids[i]), arrays.names[i], arrays.timestamps[i],
+             float(np.sqrt(max(dist[i], 0.0))), arrays.vectors[i].astype(int).tolist())
+            for i in nearest if np.isfinite(dist[i])
+        ]
+
+def build_peer_index(conn):
+    index = PeerIndex()
+    index.refresh(conn)
+    return index
@@ -0,0 +1,359 @@
+import re
+from functools import lru_cache
+
+from impact.core import DIMENSIONS
+
+TOKEN_RE = re.compile(r'\{\{(\w+)\}\}')
+CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+CSS_SPACE_RE = re.compile(r'\s*([{};:,>])\s*|\s+')
+
+# --- Page CSS ---
+PAGE_CSS_SOURCE = """
+/* Main Background */
+.stApp {
+    background-color: #ffffff;
+}
+
+/* Main content area */
+.main .block-container {
+    padding-top: 2rem;
+    max-width: 1400px;
+}
+
+/* Sidebar */
+[data-testid="stSidebar"] {
+    background-color: #f8f9fa;
+    border-right: 1px solid #e9ecef;
+}
+
+/* Headers */
+h1 {
+    color: #1a1a1a;
+    font-weight: 700;
+    font-size: 2.5rem !important;
+    margin-bottom: 0.5rem;
+    letter-spacing: -0.5px;
+}
+
+h2 {
+    color: #2d3748;
+    font-weight: 600;
+    font-size: 1.5rem !important;
+    margin-top: 1rem;
+}
+
+h3 {
+    color: #2d3748;
+    font-weight: 600;
+    font-size: 1.2rem !important;
+}
+
+/* Remove default styling */
+.stSlider {
+    padding-top: 0.5rem;
+    padding-bottom: 0.5rem;
+}
+
+/* Button styling */
+.stButton > button {
+    border-radius: 6px;
+    font-weight: 500;
+    padding: 0.5rem 1rem;
+    border: 1px solid #dee2e6;
+    background-color: white;
+    color: #495057;
+    transition: all 0.2s;
+}
+
+.stButton > button:hover {
+    background-color: #f8f9fa;
+    border-color: #adb5bd;
+}
+
+.stButton > button[kind="primary"] {
+    background-color: #0d6efd;
+    color: white;
+    border-color: #0d6efd;
+}
+
+.stButton > button[kind="primary"]:hover {
+    background-color: #0b5ed7;
+    border-color: #0a58ca;
+}
+
+/* Download button */
+.stDownloadButton > button {
+    background-color: #0d6efd;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    font-weight: 500;
+    padding: 0.5rem 1rem;
+}
+
+.stDownloadButton > button:hover {
+    background-color: #0b5ed7;
+}
+
+/* Text input */
+.stTextInput > div > div > input {
+    border-radius: 6px;
+    border: 1px solid #ced4da;
+}
+
+.stTextInput > div > div > input:focus {
+    border-color: #0d6efd;
+    box-shadow: 0 0 0 0.2rem rgba(13, 110, 253, 0.25);
+}
+
+/* Text area */
+.stTextArea textarea {
+    border-radius: 6px;
+    border: 1px solid #ced4da;
+    font-size: 0.9rem;
+}
+
+.stTextArea textarea:focus {
+    border-color: #0d6efd;
+    box-shadow: 0 0 0 0.2rem rgba(13, 110, 253, 0.25);
+}
+
+/* Expander */
+.streamlit-expanderHeader {
+    background-color: #f8f9fa;
+    border-radius: 6px;
+    font-size: 0.9rem;
+    font-weight: 500;
+    border: 1px solid #dee2e6;
+}
+
+/* Metric */
+[data-testid="stMetricValue"] {
+    font-size: 1.75rem;
+    font-weight: 600;
+    color: #1a1a1a;
+}
+
+[data-testid="stMetricLabel"] {
+    font-size: 0.875rem;
+    color: #6c757d;
+    font-weight: 500;
+}
+
+/* Rubric Table */
+.rubric-table { 
+    font-size: 0.875rem; 
+    width: 100%; 
+    border-collapse: collapse;
+    margin-top: 0.5rem;
+}
+
+.rubric-table td { 
+    padding: 0.75rem; 
+    border: 1px solid #dee2e6;
+    vertical-align: top;
+    background-color: white;
+}
+
+.rubric-header { 
+    font-weight: 600; 
+    color: #495057;
+    background-color: #f8f9fa;
+    width: 100px;
+}
+
+/* Card Container */
+.card-container {
+    background-color: white;
+    border: 1px solid #dee2e6;
+    border-radius: 8px;
+    padding: 1.5rem;
+    margin-bottom: 1rem;
+    box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
+}
+
+/* Score badge */
+.score-display {
+    font-size: 1.5rem;
+    font-weight: 700;
+    text-align: center;
+    padding: 0.5rem;
+    border-radius: 6px;
+    margin-bottom: 0.5rem;
+}
+
+.score-low {
+    background-color: #fff5f5;
+    color: #c53030;
+    border: 2px solid #fc8181;
+}
+
+.score-medium {
+    background-color: #fffbf0;
+    color: #c05621;
+    border: 2px solid #f6ad55;
+}
+
+.score-high {
+    background-color: #f0fdf4;
+    color: #15803d;
+    border: 2px solid #4ade80;
+}
+
+/* Dimension card */
+.dimension-card {
+    background: white;
+    border: 1px solid #e9ecef;
+    border-radius: 8px;
+    padding: 1.25rem;
+    height: 100%;
+    transition: box-shadow 0.2s;
+}
+
+.dimension-card:hover {
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
+}
+
+.dimension-title {
+    font-size: 1.1rem;
+    font-weight: 600;
+    color: #2d3748;
+    margin-bottom: 0.25rem;
+}
+
+.dimension-question {
+    font-size: 0.875rem;
+    color: #6c757d;
+    font-style: italic;
+    margin-bottom: 1rem;
+}
+
+/* Labels */
+.slider-label {
+    font-size: 0.8rem;
+    color: #6c757d;
+    font-weight: 500;
+}
+
+/* Portfolio percentile badges */
+.percentile-badge {
+    display: inline-block;
+    font-size: 0.7rem;
+    font-weight: 600;
+    color: #495057;
+    background: #e9ecef;
+    border-radius: 10px;
+    padding: 0.05rem 0.45rem;
+}
+
+/* Card body, labels and summary rows */
+.card-body {
+    background: white;
+    border: 1px solid #e9ecef;
+    border-top: none;
+    border-radius: 0 0 8px 8px;
+    padding: 1rem 1rem 0.1rem;
+}
+
+.slider-labels {
+    display: flex;
+    justify-content: space-between;
+    font-size: 0.8rem;
+    color: #6c757d;
+    font-weight: 500;
+}
+
+.notes-heading {
+    margin: 1rem 0 0.25rem;
+}
+
+.summary-row {
+    display: grid;
+    grid-template-columns: 0.5fr 3fr 1fr;
+    align-items: center;
+    margin-bottom: 0.5rem;
+}
+
+/* Divider */
+hr {
+    margin: 2rem 0;
+    border: none;
+    border-top: 1px solid #e9ecef;
+}
+"""
+
+def minify_css(css):
+    css = CSS_COMMENT_RE.sub('', css)
+    return CSS_SPACE_RE.sub(lambda m: m.group(1) or ' ', css).strip()
+
+PAGE_CSS = f"<style>{minify_css(PAGE_CSS_SOURCE)}</style>"
+
+# --- Templates ---
+# Static markup is rendered from DIMENSIONS once per process and split on
+# its {{tokens}} (odd indices are token names, as in the report template),
+# so a rerun only joins in the score, percentile and band strings.
+CARD_HEADER = """<div style='background: {lightColor}; padding: 0.75rem 1rem; border-radius: 8px 8px 0 0; border-left: 4px solid {color};'>
+<div style='display: flex; justify-content: space-between; align-items: center;'>
+<div>
+<div style='font-size: 1.1rem; font-weight: 600; color: #2d3748;'>{icon} {title}</div>
+<div style='font-size: 0.85rem; color: #6c757d; margin-top: 0.15rem;'>{subtitle}</div>
+</div>
+<div style='text-align: right;'>
+<div style='font-size: 1.5rem; font-weight: 700; color: {color};'>{{{{score}}}}</div>
+{{{{percentile}}}}
+</div>
+</div>
+</div>
+<div class='card-body'><div class='dimension-question'>{question}</div></div>"""
+
+CARD_LABELS = """<div class='slider-labels'><span>← {leftLabel}</span><span>{rightLabel} →</span></div>{{{{band}}}}"""
+
+RUBRIC = """<strong>Scoring Rubric</strong>
+<table class="rubric-table">
+<tr><td class="rubric-header">Low (0-30)</td><td>{low}</td></tr>
+<tr><td class="rubric-header">Medium (31-70)</td><td>{medium}</td></tr>
+<tr><td class="rubric-header">High (71-100)</td><td>{high}</td></tr>
+</table>
+<p class='notes-heading'><strong>Evidence &amp; Notes</strong></p>"""
+
+SUMMARY_ROW = """<div class='summary-row'><span style='color: {color}; font-size: 1.2rem;'>{icon}</span><strong>{title}</strong><span><span style='color: {color}; font-weight: 700;'>{{{{score}}}}</span>{{{{rank}}}}</span></div>"""
+
+def compile_template(template, **values):
+    return tuple(TOKEN_RE.split(template.format(**values)))
+
+def render(pieces, values):
+    parts = list(pieces)
+    for i in range(1, len(parts), 2):
+        parts[i] = str(values[parts[i]])
+    return ''.join(parts)
+
+@lru_cache(maxsize=None)
+def compile_dimension_templates():
+    # Returns per dimension (header pieces, label pieces, rubric html, summary row pieces)
+    return tuple((
+        compile_template(CARD_HEADER, **dim),
+        compile_template(CARD_LABELS, **dim),
+        RUBRIC.format(**dim['rubric']),
+        compile_template(SUMMARY_ROW, **dim),
+    ) for dim in DIMENSIONS)
+
+# --- Rendering ---
+def percentile_badge(text):
+    return f"<span class='percentile-badge'>{text}</span>" if text else ""
+
+def card_header_html(dim_idx, score, percentile=''):
+    return render(compile_dimension_templates()[dim_idx][0], {'score': score, 'percentile': percentile_badge(percentile)})
+
+def card_labels_html(dim_idx, band=None):
+    band_html = f"<div class='slider-label'>Portfolio middle 50%: {band[0]}–{band[1]}</div>" if band else ""
+    return render(compile_dimension_templates()[dim_idx][1], {'band': band_html})
+
+def rubric_html(dim_idx):
+    return compile_dimension_templates()[dim_idx][2]
+
+def summary_scores_html(scores, ranks=None):
+    templates = compile_dimension_templates()
+    return ''.join(
+        render(templates[i][3], {'score': score, 'rank': percentile_badge(f"P{round(ranks[i])}") if ranks is not None else ''})
+        for i, score in enumerate(scores)
+    )
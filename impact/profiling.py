@@ -0,0 +1,81 @@
+import json
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+DEFAULT_WINDOW = 500
+QUANTILES = (0.5, 0.95, 0.99)
+
+def percentile(sorted_samples, q):
+    # Nearest-rank percentile of an already sorted list: the ceil(q * n)-th
+    # sample. q * n is rounded first so float noise (0.07 * 100 is
+    # 7.000000000000001) does not push it up a rank.
+    if not sorted_samples:
+        return 0.0
+    idx = min(len(sorted_samples) - 1, max(0, math.ceil(round(q * len(sorted_samples), 9)) - 1))
+    return sorted_samples[idx]
+
+# --- Section Profiler ---
+# Times named sections of a rerun. Each section keeps a rolling window of
+# its most recent samples for percentiles, plus lifetime count and sum.
+class SectionProfiler:
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._counts = defaultdict(int)
+        self._sums = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            self._samples[name].append(seconds)
+            self._counts[name] += 1
+            self._sums[name] += seconds
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+            self._sums.clear()
+
+    def summary(self):
+        with self._lock:
+            snapshot = {name: list(samples) for name, samples in self._samples.items()}
+            counts, sums = dict(self._counts), dict(self._sums)
+        summary = {}
+        for name, samples in snapshot.items():
+            ordered = sorted(samples)
+            summary[name] = {
+                'count': counts[name],
+                'sum_ms': sums[name] * 1000,
+                'last_ms': samples[-1] * 1000,
+                **{f"p{int(q * 100)}_ms": percentile(ordered, q) * 1000 for q in QUANTILES},
+            }
+        return summary
+
+    # --- Export ---
+    def to_json(self):
+        return json.dumps({'window': self.window, 'sections': self.summary()}, indent=2)
+
+    def to_prometheus(self, metric='impact_rerun_section_seconds'):
+        lines = [
+            f"# HELP {metric} Wall time of named app rerun sections.",
+            f"# TYPE {metric} summary",
+        ]
+        for name, stats in sorted(self.summary().items()):
+            for q in QUANTILES:
+                value = stats[f"p{int(q * 100)}_ms"] / 1000
+                lines.append(f'{metric}{{section="{name}",quantile="{q}"}} {value:.6f}')
+            lines.append(f'{metric}_sum{{section="{name}"}} {stats["sum_ms"] / 1000:.6f}')
+            lines.append(f'{metric}_count{{section="{name}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
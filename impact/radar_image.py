@@ -0,0 +1,169 @@
+import hashlib
+import math
+import os
+import tempfile
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+
+from impact.charts import BENCHMARK_VALUES
+from impact.core import DIMENSIONS
+
+# Bump when the drawing changes so stale cache entries are never reused
+RENDER_VERSION = 1
+IMAGE_SIZE = (1000, 720)
+SUPERSAMPLE = 2
+DEFAULT_CACHE_DIR = os.environ.get('IMPACT_CHART_CACHE') or str(
+    Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'impact-radar' / 'charts')
+MEMORY_CACHE_SIZE = 256
+MAX_CACHE_BYTES = 256 << 20
+PRUNE_EVERY = 100
+
+CURRENT_STYLE = ('Current Analysis', (13, 110, 253), 51, 4, 8, False)
+BENCHMARK_STYLE = ('Traditional Bank', (108, 117, 125), 26, 4, 6, True)
+
+# --- Rendering ---
+# A static PNG of the same radar create_radar_chart draws (first dimension
+# at 3 o'clock, counterclockwise), rasterized with Pillow so reports need no
+# browser. Drawn at SUPERSAMPLE x size and downscaled for smooth edges.
+def load_font(size):
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.load_default(size=size)
+    except (TypeError, OSError):
+        # Pillow without FreeType only has the fixed-size bitmap font
+        return ImageFont.load_default()
+
+def dashed_line(draw, points, fill, width, dash):
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        length = math.hypot(x1 - x0, y1 - y0)
+        for start in range(0, int(length), dash * 2):
+            t0, t1 = start / length, min(start + dash, length) / length
+            draw.line([(x0 + (x1 - x0) * t0, y0 + (y1 - y0) * t0),
+                       (x0 + (x1 - x0) * t1, y0 + (y1 - y0) * t1)], fill=fill, width=width)
+
+def render_radar_png(scores, show_benchmark=True):
+    from PIL import Image, ImageDraw
+
+    s = SUPERSAMPLE
+    width, height = IMAGE_SIZE[0] * s, IMAGE_SIZE[1] * s
+    cx, cy, radius = width / 2, 320 * s, 250 * s
+    grid, text = (222, 226, 230), (73, 80, 87)
+    tick_font, label_font = load_font(11 * s), load_font(13 * s)
+
+    def point(i, value):
+        angle = 2 * math.pi * i / len(DIMENSIONS)
+        return cx + radius * value / 100 * math.cos(angle), cy - radius * value / 100 * math.sin(angle)
+
+    image = Image.new('RGB', (width, height), 'white')
+    # RGBA drawing on an RGB image blends translucent fills in place
+    draw = ImageDraw.Draw(image, 'RGBA')
+    for level in range(20, 101, 20):
+        r = radius * level / 100
+        draw.ellipse([cx - r, cy - r, cx + r, cy + r], outline=grid, width=s)
+        draw.text((cx + r - 2 * s, cy - 3 * s), str(level), fill=text, font=tick_font, anchor='rb')
+    for i, dim in enumerate(DIMENSIONS):
+        x, y = point(i, 100)
+        draw.line([(cx, cy), (x, y)], fill=grid, width=s)
+        lx, ly = point(i, 112)
+        anchor = ('l' if lx > cx + s else 'r' if lx < cx - s else 'm') + ('b' if ly < cy - radius * 0.9 else 't' if ly > cy + radius * 0.9 else 'm')
+        draw.text((lx, ly), dim['title'], fill=text, font=label_font, anchor=anchor)
+
+    series = [(scores, CURRENT_STYLE)]
+    if show_benchmark:
+        series.insert(0, (BENCHMARK_VALUES, BENCHMARK_STYLE))
+    for values, (_, color, alpha, line_width, marker, dashed) in series:
+        points = [point(i, v) for i, v in enumerate(values)]
+        draw.polygon(points, fill=color + (alpha,))
+        outline = points + points[:1]
+        if dashed:
+            dashed_line(draw, outline, color, line_width * s // 2, 6 * s)
+        else:
+            draw.line(outline, fill=color, width=line_width * s // 2, joint='curve')
+        r = marker * s / 2
+        for x, y in points:
+            draw.ellipse([x - r, y - r, x + r, y + r], fill=color)
+
+    # Legend, centered under the radar like the plotly horizontal legend
+    entries = [style for _, style in reversed(series)]
+    item_width = 190 * s
+    x = cx - item_width * len(entries) / 2
+    y = cy + radius + 60 * s
+    for name, color, _, line_width, _, dashed in entries:
+        if dashed:
+            dashed_line(draw, [(x, y), (x + 30 * s, y)], color, line_width * s // 2, 6 * s)
+        else:
+            draw.line([(x, y), (x + 30 * s, y)], fill=color, width=line_width * s // 2)
+        draw.text((x + 38 * s, y), name, fill=text, font=label_font, anchor='lm')
+        x += item_width
+
+    image = image.reduce(s)
+    buffer = BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+# --- Render Cache ---
+# Images are content-addressed by the renderer version and the chart inputs
+# and stored as <cache_dir>/<key[:2]>/<key>.png, so identical charts across
+# reports, reruns and worker processes are rendered once. Files are written
+# atomically; an unwritable cache directory only disables caching. Hits
+# refresh a file's mtime, and every PRUNE_EVERY writes the least recently
+# used files past max_bytes are deleted.
+_cache_writes = {}
+
+def radar_key(scores, show_benchmark):
+    text = f"{RENDER_VERSION}:{int(show_benchmark)}:{','.join(str(int(v)) for v in scores)}"
+    return hashlib.sha256(text.encode('ascii')).hexdigest()
+
+def prune_cache(cache_dir, max_bytes=MAX_CACHE_BYTES):
+    # Returns the number of files deleted
+    files = []
+    for path in Path(cache_dir).glob('*/*.png'):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+@lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def cached_radar_png(scores, show_benchmark, cache_dir):
+    key = radar_key(scores, show_benchmark)
+    path = Path(cache_dir) / key[:2] / f"{key}.png"
+    try:
+        data = path.read_bytes()
+    except OSError:
+        pass
+    else:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+    data = render_radar_png(scores, show_benchmark)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix='.tmp', delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+    except OSError:
+        return data
+    _cache_writes[cache_dir] = _cache_writes.get(cache_dir, 0) + 1
+    if _cache_writes[cache_dir] % PRUNE_EVERY == 1:
+        prune_cache(cache_dir)
+    return data
+
+def radar_png(scores, show_benchmark=True, cache_dir=None):
+    return cached_radar_png(tuple(int(v) for v in scores), bool(show_benchmark), str(cache_dir or DEFAULT_CACHE_DIR))
@@ -0,0 +1,130 @@
+import re
+import zipfile
+from functools import lru_cache
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from impact.core import DIMENSIONS, get_score_label
+
+DOCUMENT_PART = 'word/document.xml'
+CHART_WIDTH_INCHES = 6
+TOKEN_RE = re.compile(r'\{\{(\w+)\}\}')
+INVALID_XML_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# --- Report Template ---
+# The static skeleton (styles, headings, rubric text) is built with
+# python-docx once per process. Variable fields are {{token}} placeholders
+# that are filled straight into word/document.xml for each report, and the
+# radar chart is a placeholder picture whose media part is swapped for the
+# report's (cached) chart image.
+def build_report_skeleton():
+    from docx import Document
+    from docx.shared import Inches, Pt, RGBColor
+    from PIL import Image
+
+    from impact.radar_image import IMAGE_SIZE
+
+    doc = Document()
+
+    heading = doc.add_heading('FINTECH IMPACT RADAR ANALYSIS', 0)
+    heading.alignment = 1
+
+    doc.add_paragraph()
+    p = doc.add_paragraph()
+    run = p.add_run("Company: {{company_name}}")
+    run.bold = True
+    run.font.size = Pt(14)
+
+    p2 = doc.add_paragraph()
+    run2 = p2.add_run("Analysis Date: {{timestamp}}")
+    run2.font.size = Pt(10)
+    run2.font.color.rgb = RGBColor(108, 117, 125)
+
+    doc.add_heading('Overall IMPACT Score: {{avg_score}}/100', level=1)
+    p3 = doc.add_paragraph("Assessment: {{score_label}}")
+    p3.runs[0].italic = True
+
+    placeholder = BytesIO()
+    Image.new('RGB', IMAGE_SIZE, 'white').save(placeholder, format='PNG')
+    doc.add_picture(placeholder, width=Inches(CHART_WIDTH_INCHES))
+    doc.paragraphs[-1].alignment = 1
+
+    doc.add_page_break()
+
+    for dim in DIMENSIONS:
+        doc.add_heading(f"{dim['icon']} {dim['title']} - {{{{score_{dim['id']}}}}}/100", level=2)
+        doc.add_paragraph(f"Focus: {dim['subtitle']}")
+        doc.add_paragraph(f"Key Question: {dim['question']}")
+
+        doc.add_heading('Scoring Rubric:', level=3)
+        doc.add_paragraph(f"Low (0-30): {dim['rubric']['low']}")
+        doc.add_paragraph(f"Medium (31-70): {dim['rubric']['medium']}")
+        doc.add_paragraph(f"High (71-100): {dim['rubric']['high']}")
+
+        doc.add_heading('Analysis & Evidence:', level=3)
+        doc.add_paragraph(f"{{{{note_{dim['id']}}}}}")
+
+        doc.add_paragraph("_" * 70)
+
+    return doc
+
+@lru_cache(maxsize=None)
+def compile_report_template():
+    # Returns (static_zip, pieces, chart_part): a docx archive holding every
+    # part except word/document.xml and the chart image, document.xml split
+    # on its tokens so that odd indices are token names, and the chart
+    # image's part name.
+    buffer = BytesIO()
+    build_report_skeleton().save(buffer)
+
+    static = BytesIO()
+    with zipfile.ZipFile(buffer) as src, zipfile.ZipFile(static, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            if info.filename == DOCUMENT_PART:
+                document_xml = src.read(info).decode('utf-8')
+            elif info.filename.startswith('word/media/'):
+                chart_part = info.filename
+            else:
+                dst.writestr(info, src.read(info))
+
+    document_xml = document_xml.replace('<w:t>', '<w:t xml:space="preserve">')
+    return static.getvalue(), tuple(TOKEN_RE.split(document_xml)), chart_part
+
+def to_run_xml(text):
+    # Mirrors python-docx: newlines become breaks and tabs become tabs.
+    text = escape(INVALID_XML_RE.sub('', str(text)))
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = text.replace('\n', '</w:t><w:br/><w:t xml:space="preserve">')
+    return text.replace('\t', '</w:t><w:tab/><w:t xml:space="preserve">')
+
+def render_report_xml(pieces, values):
+    parts = list(pieces)
+    for i in range(1, len(parts), 2):
+        parts[i] = to_run_xml(values[parts[i]])
+    return ''.join(parts)
+
+# --- Report Generation ---
+def generate_word_doc(company_name, avg_score, timestamp, scores, notes, show_benchmark=True):
+    from impact.radar_image import radar_png
+
+    static_zip, pieces, chart_part = compile_report_template()
+
+    values = {
+        'company_name': company_name if company_name else 'Not specified',
+        'timestamp': timestamp,
+        'avg_score': avg_score,
+        'score_label': get_score_label(avg_score),
+    }
+    for dim, score, note in zip(DIMENSIONS, scores, notes):
+        values[f"score_{dim['id']}"] = score
+        values[f"note_{dim['id']}"] = note if note else "No notes recorded."
+
+    # Appending to a copy of the static archive reuses the already
+    # compressed styles and theme parts; only document.xml is compressed.
+    # The chart PNG is already compressed and is stored as is.
+    buffer = BytesIO(static_zip)
+    with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(DOCUMENT_PART, render_report_xml(pieces, values))
+        zf.writestr(chart_part, radar_png(scores, show_benchmark), zipfile.ZIP_STORED)
+    buffer.seek(0)
+    return buffer
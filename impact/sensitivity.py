@@ -0,0 +1,35 @@
+import numpy as np
+
+from impact.batch import CLASS_LABELS, score_matrix
+from impact.core import DIMENSIONS
+
+DEFAULT_DRAWS = 100_000
+DEFAULT_SPREAD = 10
+
+# --- Monte Carlo Sensitivity ---
+# Each dimension is drawn uniformly from its integer range
+# [score - spread, score + spread], truncated to 0-100, and every draw is
+# scored exactly like a single analysis (score_matrix). Seeded, so the same
+# inputs always give the same result and can be cached.
+def simulate_overall(scores, spreads, draws=DEFAULT_DRAWS, seed=0):
+    scores = np.asarray(scores, dtype=np.int64)
+    spreads = np.abs(np.asarray(spreads, dtype=np.int64))
+    low = np.clip(scores - spreads, 0, 100)
+    high = np.clip(scores + spreads, 0, 100)
+
+    rng = np.random.default_rng(seed)
+    samples = rng.integers(low, high + 1, size=(draws, len(DIMENSIONS)))
+    overall, classes, _ = score_matrix(samples)
+
+    p5, p50, p95 = np.percentile(overall, [5, 50, 95])
+    class_counts = np.bincount(classes, minlength=len(CLASS_LABELS))
+    return {
+        'draws': draws,
+        'mean': float(overall.mean()),
+        'std': float(overall.std()),
+        'p5': int(p5),
+        'p50': int(p50),
+        'p95': int(p95),
+        'histogram': np.bincount(overall, minlength=101).tolist(),
+        'probabilities': dict(zip(CLASS_LABELS.tolist(), (class_counts / draws).tolist())),
+    }
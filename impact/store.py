@@ -0,0 +1,334 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from impact.core import DIMENSION_IDS, HIGH_THRESHOLD, LOW_THRESHOLD, build_analysis, overall_score
+
+DEFAULT_DB_PATH = os.environ.get('IMPACT_DB_PATH', 'impact_portfolio.db')
+
+SCORE_COLUMNS = [f"score_{d}" for d in DIMENSION_IDS]
+NOTE_COLUMNS = [f"note_{d}" for d in DIMENSION_IDS]
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY,
+    company_name TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    overall_score INTEGER NOT NULL,
+    {', '.join(f'{c} INTEGER NOT NULL' for c in SCORE_COLUMNS)},
+    {', '.join(f"{c} TEXT NOT NULL DEFAULT ''" for c in NOTE_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_company ON analyses (company_name, timestamp);
+CREATE INDEX IF NOT EXISTS idx_analyses_timestamp ON analyses (timestamp);
+CREATE INDEX IF NOT EXISTS idx_analyses_score ON analyses (overall_score, timestamp);
+CREATE TABLE IF NOT EXISTS drafts (
+    draft_id TEXT PRIMARY KEY,
+    saved_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+# --- Notes Search Index ---
+# One FTS5 row per non-empty note, with rowid = analysis id * stride +
+# dimension index, so hits map back to their analysis and dimension
+# without extra columns. Triggers keep it in step with every insert.
+NOTE_ROWID_STRIDE = 8
+
+NOTES_FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(note, tokenize='unicode61 remove_diacritics 2');
+CREATE TRIGGER IF NOT EXISTS analyses_notes_insert AFTER INSERT ON analyses BEGIN
+    {' '.join(
+        f"INSERT INTO notes_fts (rowid, note) SELECT new.id * {NOTE_ROWID_STRIDE} + {i}, new.{c} WHERE new.{c} != '';"
+        for i, c in enumerate(NOTE_COLUMNS)
+    )}
+END;
+CREATE TRIGGER IF NOT EXISTS analyses_notes_delete AFTER DELETE ON analyses BEGIN
+    DELETE FROM notes_fts WHERE rowid BETWEEN old.id * {NOTE_ROWID_STRIDE} AND old.id * {NOTE_ROWID_STRIDE} + {NOTE_ROWID_STRIDE - 1};
+END;
+"""
+
+NOTES_FTS_BACKFILL = "INSERT INTO notes_fts (rowid, note) " + " UNION ALL ".join(
+    f"SELECT id * {NOTE_ROWID_STRIDE} + {i}, {c} FROM analyses WHERE {c} != ''"
+    for i, c in enumerate(NOTE_COLUMNS)
+)
+
+# Classification -> [min, max] overall score, matching get_score_label
+SCORE_RANGES = {
+    "Low Impact": (0, LOW_THRESHOLD - 1),
+    "Medium Impact": (LOW_THRESHOLD, HIGH_THRESHOLD - 1),
+    "High Impact": (HIGH_THRESHOLD, 100),
+}
+
+# --- Quarterly Aggregates ---
+# Running per-company, per-quarter sums kept by triggers, so trend views
+# read a handful of pre-aggregated rows instead of every analysis.
+QUARTER_SQL = "substr({ts}, 1, 4) || '-Q' || ((CAST(substr({ts}, 6, 2) AS INTEGER) + 2) / 3)"
+SUM_COLUMNS = [f"sum_{d}" for d in DIMENSION_IDS]
+
+QUARTERS_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS company_quarters (
+    company_name TEXT NOT NULL,
+    quarter TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    sum_overall INTEGER NOT NULL,
+    {', '.join(f'{c} INTEGER NOT NULL' for c in SUM_COLUMNS)},
+    PRIMARY KEY (company_name, quarter)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS analyses_quarters_insert AFTER INSERT ON analyses BEGIN
+    INSERT INTO company_quarters VALUES (
+        new.company_name, {QUARTER_SQL.format(ts='new.timestamp')}, 1, new.overall_score,
+        {', '.join(f'new.{c}' for c in SCORE_COLUMNS)}
+    ) ON CONFLICT (company_name, quarter) DO UPDATE SET
+        n = n + 1, sum_overall = sum_overall + excluded.sum_overall,
+        {', '.join(f'{c} = {c} + excluded.{c}' for c in SUM_COLUMNS)};
+END;
+CREATE TRIGGER IF NOT EXISTS analyses_quarters_delete AFTER DELETE ON analyses BEGIN
+    UPDATE company_quarters SET
+        n = n - 1, sum_overall = sum_overall - old.overall_score,
+        {', '.join(f'{s} = {s} - old.{c}' for s, c in zip(SUM_COLUMNS, SCORE_COLUMNS))}
+    WHERE company_name = old.company_name AND quarter = {QUARTER_SQL.format(ts='old.timestamp')};
+    DELETE FROM company_quarters WHERE n <= 0;
+END;
+"""
+
+QUARTERS_BACKFILL = f"""
+INSERT INTO company_quarters
+SELECT company_name, {QUARTER_SQL.format(ts='timestamp')}, COUNT(*), SUM(overall_score),
+       {', '.join(f'SUM({c})' for c in SCORE_COLUMNS)}
+FROM analyses GROUP BY 1, 2
+"""
+
+# --- Score Histograms ---
+# Scores are integers 0-100, so a count per (dimension, score) is an exact,
+# mergeable distribution: triggers add one per dimension on save, and
+# shards combine by summing counts. 'overall' tracks the overall score.
+HISTOGRAM_DIMENSIONS = DIMENSION_IDS + ['overall']
+
+HISTOGRAM_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS score_counts (
+    dimension TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (dimension, score)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS analyses_counts_insert AFTER INSERT ON analyses BEGIN
+    INSERT INTO score_counts VALUES
+        {', '.join(f"('{d}', new.{c}, 1)" for d, c in zip(HISTOGRAM_DIMENSIONS, SCORE_COLUMNS + ['overall_score']))}
+    ON CONFLICT (dimension, score) DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS analyses_counts_delete AFTER DELETE ON analyses BEGIN
+    {' '.join(
+        f"UPDATE score_counts SET n = n - 1 WHERE dimension = '{d}' AND score = old.{c};"
+        for d, c in zip(HISTOGRAM_DIMENSIONS, SCORE_COLUMNS + ['overall_score'])
+    )}
+END;
+"""
+
+HISTOGRAM_BACKFILL = "INSERT INTO score_counts " + " UNION ALL ".join(
+    f"SELECT '{d}', {c}, COUNT(*) FROM analyses GROUP BY {c}"
+    for d, c in zip(HISTOGRAM_DIMENSIONS, SCORE_COLUMNS + ['overall_score'])
+)
+
+# --- Connection ---
+# connect() allows a connection to be shared across threads (the app keeps
+# one for all sessions), but sqlite3 transactions are per connection, so
+# concurrent writers would commit or roll back each other's work. Every
+# write runs its transaction under WRITE_LOCK.
+WRITE_LOCK = threading.Lock()
+
+@contextmanager
+def write_transaction(conn):
+    with WRITE_LOCK, conn:
+        yield conn
+
+def connect(path=DEFAULT_DB_PATH):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    # Derived tables are filled from existing analyses when first created
+    for table, schema, backfill in (
+        ('notes_fts', NOTES_FTS_SCHEMA, NOTES_FTS_BACKFILL),
+        ('company_quarters', QUARTERS_SCHEMA, QUARTERS_BACKFILL),
+        ('score_counts', HISTOGRAM_SCHEMA, HISTOGRAM_BACKFILL),
+    ):
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (table,)).fetchone()
+        conn.executescript(schema)
+        if not exists:
+            with write_transaction(conn):
+                conn.execute(backfill)
+    return conn
+
+# --- Writes ---
+def _analysis_row(data):
+    dims = data['dimensions']
+    scores = [dims[d]['score'] for d in DIMENSION_IDS]
+    notes = [dims[d].get('notes', '') or '' for d in DIMENSION_IDS]
+    timestamp = data.get('timestamp') or datetime.now().isoformat()
+    return [data.get('company_name') or '', timestamp, overall_score(scores)] + scores + notes
+
+INSERT_SQL = (
+    f"INSERT INTO analyses (company_name, timestamp, overall_score, "
+    f"{', '.join(SCORE_COLUMNS + NOTE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (3 + 2 * len(DIMENSION_IDS)))})"
+)
+
+def save_analysis(conn, data):
+    # data is a build_analysis / export_json document
+    with write_transaction(conn):
+        cur = conn.execute(INSERT_SQL, _analysis_row(data))
+    return cur.lastrowid
+
+def save_analyses(conn, analyses):
+    with write_transaction(conn):
+        cur = conn.executemany(INSERT_SQL, map(_analysis_row, analyses))
+    return cur.rowcount
+
+# --- Reads ---
+def row_to_analysis(row):
+    scores = [row[c] for c in SCORE_COLUMNS]
+    notes = [row[c] for c in NOTE_COLUMNS]
+    data = build_analysis(row['company_name'], scores, notes, row['timestamp'])
+    data['id'] = row['id']
+    return data
+
+def load_analysis(conn, analysis_id):
+    row = conn.execute("SELECT * FROM analyses WHERE id = ?", (analysis_id,)).fetchone()
+    return row_to_analysis(row) if row else None
+
+def query_analyses(conn, company=None, classification=None, since=None, until=None,
+                   min_score=None, max_score=None, limit=100, columns='*'):
+    clauses, params = [], []
+    if company:
+        clauses.append("company_name = ?")
+        params.append(company)
+    if classification:
+        low, high = SCORE_RANGES[classification]
+        min_score = low if min_score is None else max(min_score, low)
+        max_score = high if max_score is None else min(max_score, high)
+    if min_score is not None:
+        clauses.append("overall_score >= ?")
+        params.append(min_score)
+    if max_score is not None:
+        clauses.append("overall_score <= ?")
+        params.append(max_score)
+    if since:
+        clauses.append("timestamp >= ?")
+        params.append(since.isoformat() if isinstance(since, datetime) else since)
+    if until:
+        clauses.append("timestamp < ?")
+        params.append(until.isoformat() if isinstance(until, datetime) else until)
+
+    sql = f"SELECT {columns} FROM analyses"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY timestamp DESC"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return conn.execute(sql, params).fetchall()
+
+def latest_id(conn):
+    return conn.execute("SELECT COALESCE(MAX(id), 0) FROM analyses").fetchone()[0]
+
+def recent_analyses(conn, limit=50):
+    return query_analyses(conn, limit=limit, columns="id, company_name, timestamp, overall_score")
+
+def score_histograms(conn):
+    # {dimension: [count of score 0, ..., count of score 100]} over HISTOGRAM_DIMENSIONS
+    histograms = {d: [0] * 101 for d in HISTOGRAM_DIMENSIONS}
+    for dimension, score, n in conn.execute("SELECT dimension, score, n FROM score_counts"):
+        if dimension in histograms and 0 <= score <= 100:
+            histograms[dimension][score] = n
+    return histograms
+
+# --- Drafts ---
+# Autosaved in-progress analyses, one row per browser draft id
+def save_drafts(conn, drafts):
+    # drafts: [(draft_id, build_analysis document)]
+    with write_transaction(conn):
+        conn.executemany(
+            "INSERT INTO drafts VALUES (?, ?, ?) ON CONFLICT (draft_id) DO UPDATE SET "
+            "saved_at = excluded.saved_at, data = excluded.data",
+            [(draft_id, data['timestamp'], json.dumps(data)) for draft_id, data in drafts]
+        )
+
+def prune_drafts(conn, older_than):
+    # Deletes drafts last saved before older_than (an ISO timestamp string)
+    with write_transaction(conn):
+        return conn.execute("DELETE FROM drafts WHERE saved_at < ?", (older_than,)).rowcount
+
+def load_draft(conn, draft_id):
+    row = conn.execute("SELECT data FROM drafts WHERE draft_id = ?", (draft_id,)).fetchone()
+    return json.loads(row['data']) if row else None
+
+# --- History ---
+def company_names(conn, search=None, limit=None):
+    # Distinct saved company names, optionally only those containing search
+    # (case-insensitive for ASCII); served by company_quarters' primary key
+    sql, params = "SELECT DISTINCT company_name FROM company_quarters", []
+    if search:
+        sql += " WHERE company_name LIKE ? ESCAPE '\\'"
+        params.append('%' + re.sub(r'([%_\\])', r'\\\1', search) + '%')
+    sql += " ORDER BY 1"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return [row[0] for row in conn.execute(sql, params)]
+
+def company_history(conn, company, limit=None):
+    # Every analysis of one company, oldest first (served by idx_analyses_company)
+    sql = (f"SELECT timestamp, overall_score, {', '.join(SCORE_COLUMNS)} FROM analyses "
+           f"WHERE company_name = ? ORDER BY timestamp DESC")
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return conn.execute(sql, (company,)).fetchall()[::-1]
+
+def company_quarterly(conn, company):
+    # Mean overall and dimension scores per quarter, oldest first
+    return conn.execute(
+        f"SELECT quarter, n, ROUND(1.0 * sum_overall / n, 1) AS overall_score, "
+        f"{', '.join(f'ROUND(1.0 * {s} / n, 1) AS {c}' for s, c in zip(SUM_COLUMNS, SCORE_COLUMNS))} "
+        f"FROM company_quarters WHERE company_name = ? ORDER BY quarter",
+        (company,)
+    ).fetchall()
+
+# --- Notes Search ---
+SNIPPET_START, SNIPPET_END = '\x02', '\x03'
+
+def fts_query(text):
+    # Quote each word so user input can't hit FTS5 syntax; the last word
+    # is a prefix so results update while typing.
+    words = re.findall(r'\w+', text)
+    if not words:
+        return ''
+    return ' '.join(f'"{w}"' for w in words) + '*'
+
+def search_notes(conn, text, limit=20):
+    # Returns [(analysis id, company_name, timestamp, dimension index, snippet)]
+    # best match first; matches in the snippet are wrapped in SNIPPET_START/END.
+    query = fts_query(text)
+    if not query:
+        return []
+    rows = conn.execute(
+        f"SELECT notes_fts.rowid, snippet(notes_fts, 0, ?, ?, '…', 16) "
+        f"FROM notes_fts WHERE notes_fts MATCH ? ORDER BY rank LIMIT ?",
+        (SNIPPET_START, SNIPPET_END, query, int(limit))
+    ).fetchall()
+    if not rows:
+        return []
+    ids = [r[0] // NOTE_ROWID_STRIDE for r in rows]
+    analyses = {
+        row['id']: row for row in conn.execute(
+            f"SELECT id, company_name, timestamp FROM analyses WHERE id IN ({', '.join('?' * len(ids))})",
+            ids
+        )
+    }
+    return [
+        (analysis_id, analyses[analysis_id]['company_name'], analyses[analysis_id]['timestamp'],
+         rowid % NOTE_ROWID_STRIDE, snippet)
+        for (rowid, snippet), analysis_id in zip(rows, ids) if analysis_id in analyses
+    ]
@@ -0,0 +1,119 @@
+from collections import deque
+
+DEFAULT_MAX_ENTRIES = 500
+DEFAULT_MAX_CHARS = 256 * 1024
+
+# --- Text Deltas ---
+# A text edit is stored as the one span that changed, (start, removed,
+# inserted), found by comparing slices so the scan runs at C speed. Typing,
+# pasting or deleting in a note costs only the changed characters.
+def common_prefix_length(a, b):
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def common_suffix_length(a, b, limit):
+    low, high = 0, min(len(a), len(b), limit)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid:len(a) - low] == b[len(b) - mid:len(b) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def text_delta(old, new):
+    start = common_prefix_length(old, new)
+    end = common_suffix_length(old, new, min(len(old), len(new)) - start)
+    return start, old[start:len(old) - end], new[start:len(new) - end]
+
+def apply_text_delta(text, start, removed, inserted):
+    return text[:start] + inserted + text[start + len(removed):]
+
+# --- Edit History ---
+# One entry per change set (a rerun's edits, a reset or a load), holding a
+# delta per changed key: (key, start, old, new) where start is None for
+# whole values (scores) and a text offset for string edits. Undo and redo
+# replay one entry's deltas, so restoring a step costs only its delta. The
+# oldest entries are dropped past max_entries or max_chars of stored text.
+class EditHistory:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_chars=DEFAULT_MAX_CHARS):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.state = {}
+        self.size = 0
+        self._undo = deque()
+        self._redo = []
+
+    @staticmethod
+    def entry_size(entry):
+        return sum(len(old) + len(new) if start is not None else 1 for _, start, old, new in entry)
+
+    def record(self, values):
+        # values: {key: current value}; keys seen for the first time only
+        # set the baseline. Returns True when a new entry was recorded.
+        entry = []
+        for key, value in values.items():
+            if key not in self.state:
+                self.state[key] = value
+                continue
+            old = self.state[key]
+            if old == value:
+                continue
+            if isinstance(old, str) and isinstance(value, str):
+                entry.append((key, *text_delta(old, value)))
+            else:
+                entry.append((key, None, old, value))
+            self.state[key] = value
+        if not entry:
+            return False
+
+        self.size -= sum(map(self.entry_size, self._redo))
+        self._redo.clear()
+        self._undo.append(entry)
+        self.size += self.entry_size(entry)
+        while len(self._undo) > 1 and (len(self._undo) > self.max_entries or self.size > self.max_chars):
+            self.size -= self.entry_size(self._undo.popleft())
+        return True
+
+    def _replay(self, entry, forward):
+        changed = {}
+        for key, start, old, new in entry if forward else reversed(entry):
+            before, after = (old, new) if forward else (new, old)
+            if start is None:
+                self.state[key] = after
+            else:
+                self.state[key] = apply_text_delta(self.state[key], start, before, after)
+            changed[key] = self.state[key]
+        return changed
+
+    def undo(self):
+        # Returns {key: restored value}, empty when there is nothing to undo
+        if not self._undo:
+            return {}
+        entry = self._undo.pop()
+        self._redo.append(entry)
+        return self._replay(entry, forward=False)
+
+    def redo(self):
+        if not self._redo:
+            return {}
+        entry = self._redo.pop()
+        self._undo.append(entry)
+        return self._replay(entry, forward=True)
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    def __len__(self):
+        return len(self._undo)